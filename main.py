@@ -5,24 +5,19 @@
 
 import argparse
 import base64
+import dataclasses
 import logging
 import os
 import sys
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 # 加载 .env 文件环境变量
 from dotenv import load_dotenv
 from src.config import Config
-from src.fetchers.acm_fetcher import ACMFetcher
-from src.fetchers.composite_fetcher import CompositeFetcher
-from src.fetchers.ieee_fetcher import IEEEFetcher
-from src.fetchers.metadata_fetcher import MetadataFetcher
-from src.fetchers.simple_html_fetcher import SimpleHTMLFetcher
 from src.fetchers.url_processors import ProcessedURL, process_paper_url_with_metadata
-from src.gmail_client import GmailClient, GmailClientError
-from src.llm_providers.openai_provider import OpenAIProvider
-from src.report_generator import ReportGenerator
-from src.summarizer import PaperSummarizer, SummarizerError
+
+if TYPE_CHECKING:
+    from src.gmail_client import EmailRecord
 
 
 load_dotenv()
@@ -73,6 +68,8 @@ def load_config(config_path: str = "config/config.yaml") -> Config:
 def _merge_configs(base: Config, override: Config) -> Config:
     """合并配置.
 
+    逐字段比较覆盖配置与 dataclass 声明的默认值，仅覆盖被显式修改的字段.
+
     Args:
         base: 基础配置.
         override: 覆盖配置.
@@ -80,29 +77,36 @@ def _merge_configs(base: Config, override: Config) -> Config:
     Returns:
         合并后的配置.
     """
-    # Gmail 配置
-    if override.gmail.label != "Scholar Alerts":
-        base.gmail.label = override.gmail.label
-    if not override.gmail.unread_only:
-        base.gmail.unread_only = override.gmail.unread_only
-    if override.gmail.max_emails != 50:
-        base.gmail.max_emails = override.gmail.max_emails
-
-    # Fetcher 配置
-    if override.fetcher.type != "simple_html":
-        base.fetcher.type = override.fetcher.type
-    if override.fetcher.timeout_sec != 30.0:
-        base.fetcher.timeout_sec = override.fetcher.timeout_sec
-
-    # LLM 配置
-    if override.llm.provider != "openai":
-        base.llm.provider = override.llm.provider
-    if override.llm.temperature != 0.3:
-        base.llm.temperature = override.llm.temperature
+    for section in dataclasses.fields(Config):
+        base_section = getattr(base, section.name)
+        override_section = getattr(override, section.name)
+        defaults = _section_defaults(type(base_section))
+
+        for item in dataclasses.fields(base_section):
+            value = getattr(override_section, item.name)
+            if value != getattr(defaults, item.name):
+                setattr(base_section, item.name, value)
 
     return base
 
 
+_SECTION_DEFAULTS: Dict[type, Any] = {}
+
+
+def _section_defaults(section_cls: type) -> Any:
+    """获取配置分区的默认实例（按类缓存）.
+
+    Args:
+        section_cls: 配置分区 dataclass 类型.
+
+    Returns:
+        该类型的默认实例.
+    """
+    if section_cls not in _SECTION_DEFAULTS:
+        _SECTION_DEFAULTS[section_cls] = section_cls()
+    return _SECTION_DEFAULTS[section_cls]
+
+
 def decode_credentials() -> None:
     """从环境变量解码凭证文件.
 
@@ -112,17 +116,17 @@ def decode_credentials() -> None:
     gmail_creds = os.getenv("GMAIL_CREDENTIALS")
     if gmail_creds:
         logger.debug("解码 Gmail 凭证")
-        with open("credentials.json", "w") as f:
-            f.write(base64.b64decode(gmail_creds).decode())
+        with open("credentials.json", "wb") as f:
+            f.write(base64.b64decode(gmail_creds))
 
     gmail_token = os.getenv("GMAIL_TOKEN")
     if gmail_token:
         logger.debug("解码 Gmail token")
-        with open("token.json", "w") as f:
-            f.write(base64.b64decode(gmail_token).decode())
+        with open("token.json", "wb") as f:
+            f.write(base64.b64decode(gmail_token))
 
 
-def get_unique_links(emails: List[dict]) -> List[ProcessedURL]:
+def get_unique_links(emails: List["EmailRecord"]) -> List[ProcessedURL]:
     """从邮件中提取唯一的链接.
 
     先转换 URL 格式，再基于转换后的 URL 去重，
@@ -134,18 +138,30 @@ def get_unique_links(emails: List[dict]) -> List[ProcessedURL]:
     Returns:
         唯一的 URL 列表（已转换格式）.
     """
-    seen = set()
-    unique_links: List[ProcessedURL] = []
+    processed_links = (
+        process_paper_url_with_metadata(link)
+        for email in emails
+        for link in email.links
+    )
+
+    # 按转换后的 URL 去重，保留首次出现的链接（及其标题提示）
+    unique_links: Dict[str, ProcessedURL] = {}
+    for processed_link in processed_links:
+        unique_links.setdefault(processed_link.url, processed_link)
+
+    return list(unique_links.values())
 
-    for email in emails:
-        for link in email.get("links", []):
-            # 先转换 URL 格式
-            processed_link = process_paper_url_with_metadata(link)
-            if processed_link.url not in seen:
-                seen.add(processed_link.url)
-                unique_links.append(processed_link)
 
-    return unique_links
+def _summarizer_errors() -> Tuple[type, ...]:
+    """返回用于捕获摘要器错误的异常类型.
+
+    摘要器模块延迟导入，尚未导入时不可能抛出 SummarizerError，返回空元组.
+
+    Returns:
+        异常类型元组.
+    """
+    module = sys.modules.get("src.summarizer")
+    return (module.SummarizerError,) if module is not None else ()
 
 
 def main() -> int:
@@ -172,6 +188,11 @@ def main() -> int:
         action="store_true",
         help="试运行模式，不发送邮件",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="禁用论文信息与摘要磁盘缓存（缓存条目默认 30 天后过期）",
+    )
     args = parser.parse_args()
 
     setup_logging(args.debug)
@@ -185,6 +206,11 @@ def main() -> int:
     else:
         logger.debug("未配置代理，将直接连接")
 
+    # 重量级依赖（Google API、OpenAI SDK 等）延迟到实际使用时导入
+    from src.gmail_client import GmailClient, GmailClientError
+
+    cache = None
+    session = None
     try:
         # 1. 加载配置
         logger.info("加载配置...")
@@ -223,27 +249,47 @@ def main() -> int:
 
         # 6. 初始化 Summarizer
         logger.info("初始化论文摘要器...")
+        from src.fetchers.acm_fetcher import ACMFetcher
+        from src.fetchers.cache import DiskCache
+        from src.fetchers.composite_fetcher import CompositeFetcher
+        from src.fetchers.ieee_fetcher import IEEEFetcher
+        from src.fetchers.metadata_fetcher import MetadataFetcher
+        from src.fetchers.session import create_session
+        from src.fetchers.simple_html_fetcher import SimpleHTMLFetcher
+        from src.llm_providers.openai_provider import OpenAIProvider
+        from src.summarizer import PaperSummarizer
+
+        cache = None if args.no_cache else DiskCache()
+        # 各 Fetcher 共用同一连接池，请求头由各自在请求时传入
+        session = create_session()
         summarizer = PaperSummarizer(
             fetcher=CompositeFetcher(
                 fetchers=[
                     SimpleHTMLFetcher(
                         timeout_sec=config.fetcher.timeout_sec,
                         retry_times=config.fetcher.retry_times,
+                        session=session,
                     ),
                     ACMFetcher(
                         timeout_sec=config.fetcher.timeout_sec,
                         retry_times=config.fetcher.retry_times,
+                        session=session,
                     ),
                     IEEEFetcher(
                         timeout_sec=config.fetcher.timeout_sec,
                         retry_times=config.fetcher.retry_times,
+                        session=session,
                     ),
                 ],
                 metadata_fetcher=MetadataFetcher(
                     timeout_sec=config.fetcher.timeout_sec,
+                    session=session,
                 ),
+                cache=cache,
             ),
             llm_provider=OpenAIProvider(),
+            max_workers=config.fetcher.max_workers,
+            summary_cache=cache,
         )
 
         # 7. 处理论文
@@ -258,6 +304,8 @@ def main() -> int:
 
         # 8. 生成报告
         logger.info("生成周报...")
+        from src.report_generator import ReportGenerator
+
         generator = ReportGenerator(config.report)
 
         if config.report.format == "html":
@@ -290,7 +338,7 @@ def main() -> int:
             # 10. 标记邮件为已读
             if config.gmail.mark_as_read:
                 logger.info("标记邮件为已读...")
-                message_ids = [email["id"] for email in emails]
+                message_ids = [email.id for email in emails]
                 gmail_client.batch_mark_as_read(message_ids)
 
             logger.info("周报发送成功！")
@@ -307,12 +355,17 @@ def main() -> int:
     except GmailClientError as e:
         logger.error(f"Gmail 客户端错误: {e}")
         return 1
-    except SummarizerError as e:
+    except _summarizer_errors() as e:
         logger.error(f"摘要器错误: {e}")
         return 1
     except Exception as e:
         logger.exception(f"未知错误: {e}")
         return 1
+    finally:
+        if cache is not None:
+            cache.close()
+        if session is not None:
+            session.close()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,9 @@ from typing import Dict, Any
 
 import yaml
 
+# 优先使用 libyaml 提供的 C 实现 Loader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class GmailConfig:
@@ -29,6 +32,7 @@ class FetcherConfig:
     timeout_sec: float = 30.0
     retry_times: int = 3
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    max_workers: int = 8  # 并发处理论文的线程数
 
 
 @dataclass
@@ -76,8 +80,8 @@ class Config:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"配置文件不存在: {config_path}")
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        with open(config_path, "rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         return cls._from_dict(data)
 
@@ -111,6 +115,9 @@ class Config:
         fetcher_timeout = os.getenv("FETCHER_TIMEOUT")
         if fetcher_timeout:
             config.fetcher.timeout_sec = float(fetcher_timeout)
+        fetcher_max_workers = os.getenv("FETCHER_MAX_WORKERS")
+        if fetcher_max_workers:
+            config.fetcher.max_workers = int(fetcher_max_workers)
 
         # LLM 配置
         llm_provider = os.getenv("LLM_PROVIDER")
@@ -153,6 +160,7 @@ class Config:
                     "user_agent",
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 ),
+                max_workers=int(fetcher_data.get("max_workers", 8)),
             ),
             llm=LLMConfig(
                 provider=llm_data.get("provider", "openai"),
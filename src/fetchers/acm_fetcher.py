@@ -3,6 +3,7 @@
 import logging
 import re
 import time
+from typing import Optional
 from urllib.parse import urlparse
 
 import requests
@@ -16,6 +17,7 @@ from .html_metadata import (
     is_blocked_text,
     normalize_whitespace,
 )
+from .session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ class ACMFetcher(PaperFetcher):
         timeout_sec: float = 30.0,
         retry_times: int = 3,
         user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        session: Optional[requests.Session] = None,
     ):
         """初始化 ACMFetcher.
 
@@ -35,11 +38,12 @@ class ACMFetcher(PaperFetcher):
             timeout_sec: 请求超时时间，单位秒.
             retry_times: 重试次数.
             user_agent: User-Agent 字符串.
+            session: 共享的 HTTP 会话，默认新建.
         """
         self.timeout_sec = timeout_sec
         self.retry_times = retry_times
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.session = session or create_session()
+        self._headers = {"User-Agent": user_agent}
 
     def can_fetch(self, url: str) -> bool:
         """检查是否可以处理 ACM Digital Library DOI 页面.
@@ -73,7 +77,9 @@ class ACMFetcher(PaperFetcher):
         last_error = ""
         for attempt in range(self.retry_times):
             try:
-                response = self.session.get(url, timeout=self.timeout_sec)
+                response = self.session.get(
+                    url, headers=self._headers, timeout=self.timeout_sec
+                )
                 response.raise_for_status()
                 return self._parse_html(response.text, url)
             except requests.Timeout:
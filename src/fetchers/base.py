@@ -4,48 +4,33 @@
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
 from typing import Dict, List
 
 
+@dataclass(slots=True, frozen=True)
 class PaperInfo:
-    """论文信息数据结构."""
-
-    def __init__(
-        self,
-        title: str,
-        authors: List[str],
-        abstract: str,
-        url: str,
-        year: str = "",
-        venue: str = "",
-    ):
-        """初始化论文信息.
+    """论文信息数据结构.
+
+    Attributes:
+        title: 论文标题.
+        authors: 作者列表.
+        abstract: 论文摘要.
+        url: 论文 URL.
+        year: 发表年份.
+        venue: 发表 venues.
+    """
 
-        Args:
-            title: 论文标题.
-            authors: 作者列表.
-            abstract: 论文摘要.
-            url: 论文 URL.
-            year: 发表年份.
-            venue: 发表 venues.
-        """
-        self.title = title
-        self.authors = authors
-        self.abstract = abstract
-        self.url = url
-        self.year = year
-        self.venue = venue
+    title: str
+    authors: List[str]
+    abstract: str
+    url: str
+    year: str = ""
+    venue: str = ""
 
     def to_dict(self) -> Dict:
         """转换为字典."""
-        return {
-            "title": self.title,
-            "authors": self.authors,
-            "abstract": self.abstract,
-            "url": self.url,
-            "year": self.year,
-            "venue": self.venue,
-        }
+        return asdict(self)
 
 
 class PaperFetcher(ABC):
@@ -0,0 +1,123 @@
+"""论文信息磁盘缓存.
+
+基于 sqlite3 的简单键值缓存，跨运行复用已解析的论文信息，
+避免重复抓取同一篇论文.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".cache/papers.sqlite3"
+# 缓存条目默认有效期（30 天），过期后重新抓取
+DEFAULT_TTL_SEC = 30 * 24 * 3600
+
+
+class DiskCache:
+    """基于 sqlite3 的 JSON 键值缓存.
+
+    键为任意字符串，按原样存储，可用 make_key 生成定长的 BLAKE2b 摘要键；
+    值为可 JSON 序列化的字典.
+    单个连接配合锁使用，可在多线程间共享. 条目超过有效期后视为不存在，
+    打开缓存时清理过期条目.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_sec: Optional[float] = DEFAULT_TTL_SEC,
+    ):
+        """初始化缓存.
+
+        Args:
+            path: sqlite 数据库文件路径，目录不存在时自动创建.
+            ttl_sec: 条目有效期，单位秒，None 表示永不过期.
+        """
+        self.path = path
+        self.ttl_sec = ttl_sec
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT, created_at REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+        if "created_at" not in columns:
+            # 旧版本缓存没有写入时间，迁移后这些条目按已过期处理
+            self._conn.execute(
+                "ALTER TABLE cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0"
+            )
+        if ttl_sec is not None:
+            self._conn.execute(
+                "DELETE FROM cache WHERE created_at < ?", (time.time() - ttl_sec,)
+            )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """根据若干字符串生成缓存键.
+
+        Args:
+            parts: 参与生成键的字符串.
+
+        Returns:
+            128 位 BLAKE2b 十六进制摘要.
+        """
+        data = "\x1f".join(parts).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取缓存.
+
+        Args:
+            key: 缓存键.
+
+        Returns:
+            缓存的字典，不存在、已过期或损坏时返回 None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if self.ttl_sec is not None and row[1] < time.time() - self.ttl_sec:
+            return None
+
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            logger.warning(f"缓存数据损坏，忽略: {key}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """写入缓存.
+
+        Args:
+            key: 缓存键.
+            value: 可 JSON 序列化的字典.
+        """
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """关闭数据库连接."""
+        with self._lock:
+            self._conn.close()
@@ -3,10 +3,15 @@
 import logging
 from typing import List, Optional
 
+import requests
+
 from .acm_fetcher import ACMFetcher
 from .base import PaperFetchError, PaperFetcher, PaperInfo
+from .cache import DiskCache
+from .html_metadata import is_blocked_text
 from .ieee_fetcher import IEEEFetcher
 from .metadata_fetcher import MetadataFetcher
+from .session import create_session
 from .simple_html_fetcher import SimpleHTMLFetcher
 from .url_processors import ProcessedURL, URLProcessorChain, default_processor_chain
 
@@ -21,6 +26,7 @@ class CompositeFetcher(PaperFetcher):
         fetchers: Optional[List[PaperFetcher]] = None,
         metadata_fetcher: Optional[MetadataFetcher] = None,
         url_processor: Optional[URLProcessorChain] = None,
+        cache: Optional[DiskCache] = None,
     ):
         """初始化 CompositeFetcher.
 
@@ -28,22 +34,32 @@ class CompositeFetcher(PaperFetcher):
             fetchers: 具体 Fetcher 列表，按顺序匹配.
             metadata_fetcher: 公开元数据源 Fetcher.
             url_processor: URL 处理器链，默认使用内置处理器.
+            cache: 论文信息磁盘缓存，None 表示不使用缓存.
         """
         self.fetchers = fetchers or self.default_fetchers()
         self.metadata_fetcher = metadata_fetcher or MetadataFetcher()
         self.url_processor = url_processor or default_processor_chain
+        self.cache = cache
 
     @staticmethod
-    def default_fetchers() -> List[PaperFetcher]:
+    def default_fetchers(
+        session: Optional[requests.Session] = None,
+    ) -> List[PaperFetcher]:
         """创建默认 Fetcher 列表.
 
+        各页面 Fetcher 共用同一个带连接池的 Session，批量处理时复用 keep-alive 连接.
+
+        Args:
+            session: 共享的 HTTP 会话，默认新建.
+
         Returns:
             默认 Fetcher 列表.
         """
+        session = session or create_session()
         return [
-            SimpleHTMLFetcher(),
-            ACMFetcher(),
-            IEEEFetcher(),
+            SimpleHTMLFetcher(session=session),
+            ACMFetcher(session=session),
+            IEEEFetcher(session=session),
         ]
 
     def can_fetch(self, url: str) -> bool:
@@ -76,6 +92,43 @@ class CompositeFetcher(PaperFetcher):
     def fetch_processed(self, processed: ProcessedURL) -> PaperInfo:
         """按处理后的 URL 和元数据提示获取论文信息.
 
+        Args:
+            processed: 处理后的 URL 信息.
+
+        Returns:
+            PaperInfo 对象.
+
+        Raises:
+            PaperFetchError: 所有获取方式均失败.
+        """
+        if self.cache is None:
+            return self._fetch_uncached(processed)
+
+        key = DiskCache.make_key("paper", processed.url)
+        cached = self.cache.get(key)
+        if cached is not None:
+            try:
+                paper_info = PaperInfo(**cached)
+            except TypeError as e:
+                # 字段变更或数据损坏时按未命中处理，重新获取后覆盖旧条目
+                logger.warning(f"论文缓存无法还原，重新获取: {processed.url} - {e}")
+            else:
+                logger.debug(f"命中论文缓存: {processed.url}")
+                return paper_info
+
+        paper_info = self._fetch_uncached(processed)
+        # 只缓存有效结果，避免空摘要或反爬页面被长期复用
+        if (
+            paper_info.abstract.strip()
+            and not is_blocked_text(paper_info.title)
+            and not is_blocked_text(paper_info.abstract)
+        ):
+            self.cache.set(key, paper_info.to_dict())
+        return paper_info
+
+    def _fetch_uncached(self, processed: ProcessedURL) -> PaperInfo:
+        """不经过缓存，按路由规则获取论文信息.
+
         Args:
             processed: 处理后的 URL 信息.
 
@@ -6,6 +6,7 @@
 参考: https://docling-project.github.io/docling/
 """
 
+import importlib.util
 import logging
 from typing import TYPE_CHECKING
 
@@ -49,17 +50,18 @@ class DoclingFetcher(PaperFetcher):
         self._docling_available = self._check_docling()
 
     def _check_docling(self) -> bool:
-        """检查 docling 是否已安装."""
-        try:
-            import docling  # noqa: F401
+        """检查 docling 是否已安装.
 
+        仅查找模块规格，不实际导入 docling，真正使用时再在 fetch 中导入.
+        """
+        if importlib.util.find_spec("docling") is not None:
             return True
-        except ImportError:
-            logger.warning(
-                "docling 未安装，将使用默认的 SimpleHTMLFetcher. "
-                "运行: pip install docling 以启用高级功能."
-            )
-            return False
+
+        logger.warning(
+            "docling 未安装，将使用默认的 SimpleHTMLFetcher. "
+            "运行: pip install docling 以启用高级功能."
+        )
+        return False
 
     def can_fetch(self, url: str) -> bool:
         """检查是否可以处理该 URL.
@@ -9,6 +9,7 @@ import requests
 
 from .base import PaperFetchError, PaperInfo
 from .html_metadata import is_blocked_text, normalize_whitespace
+from .session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -19,22 +20,26 @@ class MetadataFetcher:
     OPENALEX_WORKS_URL = "https://api.openalex.org/works"
     CROSSREF_WORKS_URL = "https://api.crossref.org/works"
 
-    def __init__(self, timeout_sec: float = 20.0):
+    def __init__(
+        self,
+        timeout_sec: float = 20.0,
+        session: Optional[requests.Session] = None,
+    ):
         """初始化 MetadataFetcher.
 
         Args:
             timeout_sec: 请求超时时间，单位秒.
+            session: 共享的 HTTP 会话，默认新建.
         """
         self.timeout_sec = timeout_sec
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "gmail-scholar-summary/0.1 "
-                    "(https://github.com/Zhaoyilunnn/gmail-scholar-summary)"
-                )
-            }
-        )
+        self.session = session or create_session()
+        # 访问公开 API 使用独立的 User-Agent，随每次请求传递
+        self._headers = {
+            "User-Agent": (
+                "gmail-scholar-summary/0.1 "
+                "(https://github.com/Zhaoyilunnn/gmail-scholar-summary)"
+            )
+        }
 
     def fetch(
         self,
@@ -155,7 +160,9 @@ class MetadataFetcher:
     ) -> Dict[str, Any]:
         """发送 GET 请求并解析 JSON."""
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout_sec)
+            response = self.session.get(
+                url, params=params, headers=self._headers, timeout=self.timeout_sec
+            )
             if response.status_code == 404:
                 return {}
             response.raise_for_status()
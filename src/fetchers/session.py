@@ -0,0 +1,26 @@
+"""HTTP 会话工厂.
+
+各 Fetcher 共用的 requests.Session 创建逻辑，统一配置连接池.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 每个 host 的连接池大小，需不小于并发线程数，否则多余连接用完即被丢弃
+POOL_MAXSIZE = 32
+
+
+def create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """创建启用 keep-alive 连接池的 Session.
+
+    Args:
+        pool_maxsize: 每个 host 保留的最大连接数.
+
+    Returns:
+        requests.Session 对象.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -4,18 +4,111 @@
 """
 
 import logging
+import random
 import re
 import time
-from typing import Optional
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base import PaperFetchError, PaperFetcher, PaperInfo
+from .session import create_session
 from .url_processors import URLProcessorChain, default_processor_chain
 
 logger = logging.getLogger(__name__)
 
+# 标题中的 [PDF] [HTML] 等标签
+_BRACKET_TAG_RE = re.compile(r"\[.*?\]")
+# arXiv 页面标题/摘要前缀
+_TITLE_PREFIX_RE = re.compile(r"^Title:\s*")
+_ABSTRACT_PREFIX_RE = re.compile(r"^Abstract:\s*")
+_YEAR_RE = re.compile(r"(\d{4})")
+
+# 支持的 host 及页面类型，同时匹配其子域名（如 export.arxiv.org）
+_HOST_PAGE_TYPES = {
+    "scholar.google.com": "scholar",
+    "arxiv.org": "arxiv",
+}
+
+# Scholar 页面选择器：搜索结果页 / 详情页
+_SCHOLAR_TITLE_SELECTOR = "h3.gs_rt, #gsc_vcd_title"
+_SCHOLAR_AUTHOR_SELECTOR = ".gs_a, .gsc_vcd_value"
+_SCHOLAR_ABSTRACT_SELECTOR = ".gs_rs, .gsc_vcd_value div"
+
+
+class _ScholarStrainer(SoupStrainer):
+    """Scholar 页面解析过滤器，额外保留详情页标题节点.
+
+    SoupStrainer 的多个属性条件之间是“且”的关系，详情页标题只有 id，
+    因此单独放行该 id.
+    """
+
+    def allow_tag_creation(
+        self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, str]]
+    ) -> bool:
+        """判断解析时是否创建该标签."""
+        if attrs and attrs.get("id") == "gsc_vcd_title":
+            return True
+        return super().allow_tag_creation(nsprefix, name, attrs)
+
+
+# 只解析提取字段所在的节点，其余子树在解析阶段直接跳过
+_SCHOLAR_STRAINER = _ScholarStrainer(
+    attrs={"class": re.compile(r"\b(gs_rt|gs_a|gs_rs|gsc_vcd_value)\b")}
+)
+_ARXIV_STRAINER = SoupStrainer(
+    ["h1", "div", "blockquote"],
+    attrs={"class": re.compile(r"\b(title|authors|abstract|dateline)\b")},
+)
+
+# 单个页面最多读取的字节数，所需字段都位于页面前部
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+def _backoff_delay(retry: int) -> float:
+    """计算第 retry 次重试前的等待时间（指数退避 + 随机抖动）.
+
+    抖动避免并发请求在同一时刻集中重试.
+
+    Args:
+        retry: 重试序号，从 0 开始.
+
+    Returns:
+        等待秒数.
+    """
+    return 2**retry + random.uniform(0, 0.5)
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    """判断 HTTP 状态码是否值得重试（限流或服务端错误）.
+
+    Args:
+        status_code: HTTP 状态码.
+
+    Returns:
+        是否重试.
+    """
+    return status_code == 429 or status_code >= 500
+
+
+def _detect_page_type(url: str) -> Optional[str]:
+    """根据 URL 的 host 判断页面类型.
+
+    Args:
+        url: 页面 URL.
+
+    Returns:
+        页面类型（scholar / arxiv），不支持时返回 None.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    for domain, page_type in _HOST_PAGE_TYPES.items():
+        if host == domain or host.endswith("." + domain):
+            return page_type
+    return None
+
 
 class SimpleHTMLFetcher(PaperFetcher):
     """基于 BeautifulSoup 的简单 HTML 解析器.
@@ -29,6 +122,7 @@ class SimpleHTMLFetcher(PaperFetcher):
         retry_times: int = 3,
         user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         url_processor: Optional[URLProcessorChain] = None,
+        session: Optional[requests.Session] = None,
     ):
         """初始化 Fetcher.
 
@@ -37,12 +131,14 @@ class SimpleHTMLFetcher(PaperFetcher):
             retry_times: 重试次数.
             user_agent: User-Agent 字符串.
             url_processor: URL 处理器链，默认使用内置处理器.
+            session: 共享的 HTTP 会话，默认新建.
         """
         self.timeout_sec = timeout_sec
         self.retry_times = retry_times
         self.user_agent = user_agent
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.session = session or create_session()
+        # 请求头随每次请求传递，避免修改可能被多个 Fetcher 共用的会话
+        self._headers = {"User-Agent": user_agent, "Accept": "text/html"}
         self.url_processor = url_processor or default_processor_chain
 
     def can_fetch(self, url: str) -> bool:
@@ -54,7 +150,7 @@ class SimpleHTMLFetcher(PaperFetcher):
         Returns:
             是否可以处理.
         """
-        return "scholar.google.com" in url or "arxiv.org" in url
+        return _detect_page_type(url) is not None
 
     def fetch(self, url: str) -> PaperInfo:
         """从 URL 获取论文信息.
@@ -68,27 +164,63 @@ class SimpleHTMLFetcher(PaperFetcher):
         Raises:
             PaperFetchError: 获取失败.
         """
-        if not self.can_fetch(url):
-            raise PaperFetchError(f"不支持的 URL: {url}")
-
         # 使用处理器链清理和转换 URL
         processed_url = self.url_processor.process(url)
         if processed_url != url:
             logger.info(f"URL 已转换: {url[:60]}... -> {processed_url[:60]}...")
 
+        # 按转换后的 URL 判断页面类型，不支持时在发起请求前失败
+        page_type = _detect_page_type(processed_url)
+        if page_type is None:
+            raise PaperFetchError(f"不支持的 URL: {processed_url}")
+
         logger.debug(f"开始获取论文信息: {processed_url}")
 
-        # 重试机制
+        # 重试机制：超时和 5xx/429 按指数退避重试，连接失败只重试一次，
+        # 其余 4xx 等错误重试无意义，直接失败
         last_error = None
+        connection_failures = 0
         for attempt in range(self.retry_times):
+            if attempt > 0:
+                time.sleep(_backoff_delay(attempt - 1))
             try:
-                response = self.session.get(processed_url, timeout=self.timeout_sec)
-                response.raise_for_status()
-                return self._parse_html(response.text, processed_url)
+                response = self.session.get(
+                    processed_url,
+                    headers=self._headers,
+                    timeout=self.timeout_sec,
+                    stream=True,
+                )
+                try:
+                    response.raise_for_status()
+                    content = self._read_body(response)
+                    encoding = self._declared_encoding(response)
+                finally:
+                    response.close()
+                return self._parse_html(content, processed_url, page_type, encoding)
             except requests.Timeout:
                 last_error = f"请求超时 (尝试 {attempt + 1}/{self.retry_times})"
                 logger.warning(f"{last_error}: {processed_url}")
-                time.sleep(1 * (attempt + 1))  # 指数退避
+            except requests.HTTPError as e:
+                status_code = e.response.status_code if e.response is not None else 0
+                if not _is_retryable_status(status_code):
+                    last_error = f"请求失败: {e}"
+                    logger.error(f"{last_error}: {processed_url}")
+                    raise PaperFetchError(
+                        f"获取论文失败: {processed_url} - {last_error}"
+                    )
+                last_error = (
+                    f"服务端错误 {status_code} (尝试 {attempt + 1}/{self.retry_times})"
+                )
+                logger.warning(f"{last_error}: {processed_url}")
+            except requests.ConnectionError as e:
+                connection_failures += 1
+                last_error = f"连接失败: {e}"
+                if connection_failures > 1:
+                    logger.error(f"{last_error}: {processed_url}")
+                    raise PaperFetchError(
+                        f"获取论文失败: {processed_url} - {last_error}"
+                    )
+                logger.warning(f"{last_error}: {processed_url}")
             except requests.RequestException as e:
                 last_error = f"请求失败: {e}"
                 logger.error(f"{last_error}: {processed_url}")
@@ -98,12 +230,58 @@ class SimpleHTMLFetcher(PaperFetcher):
             f"获取论文失败，已重试 {self.retry_times} 次: {processed_url}"
         )
 
-    def _parse_html(self, html: str, url: str) -> PaperInfo:
+    def _read_body(self, response: requests.Response) -> bytes:
+        """读取响应正文，超过 MAX_RESPONSE_BYTES 的部分直接丢弃.
+
+        Args:
+            response: 以 stream 模式获取的响应.
+
+        Returns:
+            原始 HTML 字节，交由解析器按页面声明的编码解码.
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_RESPONSE_BYTES:
+                logger.debug(f"响应超过 {MAX_RESPONSE_BYTES} 字节，截断读取")
+                break
+
+        return b"".join(chunks)[:MAX_RESPONSE_BYTES]
+
+    @staticmethod
+    def _declared_encoding(response: requests.Response) -> Optional[str]:
+        """获取响应头 Content-Type 中显式声明的编码.
+
+        未声明 charset 时 requests 会对 text/* 默认返回 ISO-8859-1，
+        此时返回 None，交由解析器根据 <meta charset> 等信息自行检测.
+
+        Args:
+            response: HTTP 响应.
+
+        Returns:
+            编码名称，未声明时返回 None.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if "charset=" not in content_type.lower():
+            return None
+        return response.encoding
+
+    def _parse_html(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        page_type: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ) -> PaperInfo:
         """解析 HTML 提取论文信息.
 
         Args:
-            html: HTML 内容.
+            html: HTML 内容，可以是文本或原始字节.
             url: 页面 URL.
+            page_type: 页面类型，为 None 时根据 URL 判断.
+            encoding: 字节内容的已知编码，为 None 时由解析器检测.
 
         Returns:
             PaperInfo 对象.
@@ -111,15 +289,27 @@ class SimpleHTMLFetcher(PaperFetcher):
         Raises:
             PaperFetchError: 解析失败.
         """
-        soup = BeautifulSoup(html, "lxml")
-
-        if "scholar.google.com" in url:
-            return self._parse_scholar(soup, url)
-        elif "arxiv.org" in url:
-            return self._parse_arxiv(soup, url)
+        if page_type is None:
+            page_type = _detect_page_type(url)
+
+        # 先确定页面类型，不支持的 URL 无需构建 DOM
+        if page_type == "scholar":
+            parser, strainer = self._parse_scholar, _SCHOLAR_STRAINER
+        elif page_type == "arxiv":
+            parser, strainer = self._parse_arxiv, _ARXIV_STRAINER
         else:
             raise PaperFetchError(f"无法解析 URL: {url}")
 
+        try:
+            soup = BeautifulSoup(
+                html, "lxml", parse_only=strainer, from_encoding=encoding
+            )
+            return parser(soup, url)
+        except PaperFetchError:
+            # 页面结构不符合预期（如只有详情页标题或通用 h1），回退到完整解析
+            logger.debug(f"局部解析未找到标题，回退到完整解析: {url}")
+            return parser(BeautifulSoup(html, "lxml", from_encoding=encoding), url)
+
     def _parse_scholar(self, soup: BeautifulSoup, url: str) -> PaperInfo:
         """解析 Google Scholar 页面.
 
@@ -130,49 +320,30 @@ class SimpleHTMLFetcher(PaperFetcher):
         Returns:
             PaperInfo 对象.
         """
-        # 尝试多种选择器获取标题
+        # 搜索结果页与详情页的结构互斥，合并为一次选择器查询；
+        # 通用 h1 优先级最低，单独兜底
         title = ""
-        title_selectors = [
-            "h3.gs_rt",  # 搜索结果标题
-            "#gsc_vcd_title",  # 详情页标题
-            "h1",  # 一般标题
-        ]
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-                # 去除 [PDF] [HTML] 等标签
-                title = re.sub(r"\[.*?\]", "", title).strip()
-                break
+        title_elem = soup.select_one(_SCHOLAR_TITLE_SELECTOR) or soup.select_one("h1")
+        if title_elem:
+            title = title_elem.get_text(strip=True)
+            # 去除 [PDF] [HTML] 等标签，大多数标题不含方括号，无需进入正则
+            if "[" in title:
+                title = _BRACKET_TAG_RE.sub("", title).strip()
 
         # 获取作者
         authors = []
-        author_selectors = [
-            ".gs_a",  # 搜索结果作者信息
-            ".gsc_vcd_value",  # 详情页
-        ]
-        for selector in author_selectors:
-            author_elem = soup.select_one(selector)
-            if author_elem:
-                author_text = author_elem.get_text(strip=True)
-                # 提取作者名（通常以 - 或 , 分隔）
-                if " - " in author_text:
-                    authors = [
-                        a.strip() for a in author_text.split(" - ")[0].split(",")
-                    ]
-                break
+        author_elem = soup.select_one(_SCHOLAR_AUTHOR_SELECTOR)
+        if author_elem:
+            author_text = author_elem.get_text(strip=True)
+            # 提取作者名（通常以 - 或 , 分隔）
+            if " - " in author_text:
+                authors = [a.strip() for a in author_text.split(" - ")[0].split(",")]
 
         # 获取摘要
         abstract = ""
-        abstract_selectors = [
-            ".gs_rs",  # 搜索结果摘要
-            ".gsc_vcd_value div",  # 详情页摘要
-        ]
-        for selector in abstract_selectors:
-            abstract_elem = soup.select_one(selector)
-            if abstract_elem:
-                abstract = abstract_elem.get_text(strip=True)
-                break
+        abstract_elem = soup.select_one(_SCHOLAR_ABSTRACT_SELECTOR)
+        if abstract_elem:
+            abstract = abstract_elem.get_text(strip=True)
 
         if not title:
             raise PaperFetchError(f"无法从 Google Scholar 页面提取标题: {url}")
@@ -200,7 +371,7 @@ class SimpleHTMLFetcher(PaperFetcher):
         if title_elem:
             title = title_elem.get_text(strip=True)
             # 去除 "Title:" 前缀
-            title = re.sub(r"^Title:\s*", "", title)
+            title = _TITLE_PREFIX_RE.sub("", title)
 
         # 获取作者
         authors = []
@@ -216,7 +387,7 @@ class SimpleHTMLFetcher(PaperFetcher):
         if abstract_elem:
             abstract = abstract_elem.get_text(strip=True)
             # 去除 "Abstract:" 前缀
-            abstract = re.sub(r"^Abstract:\s*", "", abstract)
+            abstract = _ABSTRACT_PREFIX_RE.sub("", abstract)
 
         # 获取年份
         year = ""
@@ -224,7 +395,7 @@ class SimpleHTMLFetcher(PaperFetcher):
         if dateline_elem:
             dateline_text = dateline_elem.get_text(strip=True)
             # 提取年份
-            year_match = re.search(r"(\d{4})", dateline_text)
+            year_match = _YEAR_RE.search(dateline_text)
             if year_match:
                 year = year_match.group(1)
 
@@ -5,31 +5,65 @@
 以及将 arXiv PDF 链接转换为 Abstract 页面.
 """
 
+import functools
 import logging
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from html import unescape as html_unescape
-from typing import List, Optional
-from urllib.parse import parse_qs, unquote, urlparse
+from typing import List, Optional, Tuple
+from urllib.parse import unquote, unquote_plus, urlparse
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProcessedURL:
-    """处理后的论文 URL 及元数据提示."""
+    """处理后的论文 URL 及元数据提示.
+
+    不可变对象，可被缓存结果安全地共享.
+    """
 
     url: str
     title_hint: str = ""
 
 
+def _get_query_param(query: str, name: str) -> str:
+    """从查询串中取出单个参数的值.
+
+    与 parse_qs(query)[name][0] 语义一致（按 & 分隔、+ 视为空格、忽略空值、
+    取首个出现的值），但只解码目标参数，不构建完整的参数字典.
+
+    Args:
+        query: URL 查询串（不含 ?）.
+        name: 参数名.
+
+    Returns:
+        解码后的参数值，不存在或为空时返回空字符串.
+    """
+    for pair in query.split("&"):
+        key, sep, value = pair.partition("=")
+        if not sep or not value:
+            continue
+        if "%" in key or "+" in key:
+            key = unquote_plus(key)
+        if key == name:
+            return unquote_plus(value)
+    return ""
+
+
 class URLProcessor(ABC):
     """URL 处理器抽象基类.
 
     所有具体的 URL 处理器都需要继承此类.
     """
 
+    __slots__ = ()
+
+    # can_process 可能返回 True 的 URL 必然包含的小写子串，处理器链据此
+    # 直接跳过无关 URL；为 None 表示无法限定，链会逐个询问处理器
+    HOST_MARKERS: Optional[Tuple[str, ...]] = None
+
     @abstractmethod
     def can_process(self, url: str) -> bool:
         """检查是否能处理该 URL.
@@ -62,6 +96,16 @@ class GoogleScholarProcessor(URLProcessor):
     格式的链接中提取实际 URL.
     """
 
+    __slots__ = ()
+
+    HOST_MARKERS = ("scholar.google.com",)
+
+    # 邮件中最常见的规范写法，命中时无需 urlparse
+    REDIRECT_PREFIXES = (
+        "https://scholar.google.com/scholar_url?",
+        "https://scholar.google.com/scholar_share?",
+    )
+
     def can_process(self, url: str) -> bool:
         """检查是否是 Google Scholar 重定向链接."""
         return self._is_scholar_redirect(url)
@@ -107,20 +151,25 @@ class GoogleScholarProcessor(URLProcessor):
             return ProcessedURL(url=url)
 
         url = html_unescape(url)
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-        if "url" not in query_params:
+        # 只需要查询串，直接按 ? / # 切分，不做完整的 urlparse
+        query = url.partition("?")[2].partition("#")[0]
+        target = _get_query_param(query, "url")
+        if not target:
             return ProcessedURL(url=url)
 
-        actual_url = unquote(query_params["url"][0])
-        title_hint = ""
-        if "rt" in query_params:
-            title_hint = unquote(query_params["rt"][0]).replace("+", " ").strip()
+        actual_url = unquote(target)
+        title_hint = unquote(_get_query_param(query, "rt")).replace("+", " ").strip()
 
         return ProcessedURL(url=actual_url, title_hint=title_hint)
 
     def _is_scholar_redirect(self, url: str) -> bool:
         """检查是否是 Google Scholar URL 包装链接."""
+        if url.startswith(self.REDIRECT_PREFIXES):
+            return True
+        # 绝大多数链接不是 Scholar 链接，先用子串检查跳过解析
+        if "scholar.google.com" not in url.lower():
+            return False
+
         url = html_unescape(url)
         parsed = urlparse(url)
         return parsed.netloc.lower() == "scholar.google.com" and parsed.path in {
@@ -135,8 +184,15 @@ class ArxivProcessor(URLProcessor):
     将 arXiv PDF 链接转换为 Abstract 页面链接.
     """
 
-    # arXiv ID 格式: 4位年份2位月份.5位序号 (如 2401.12345)
-    ARXIV_ID_PATTERN = re.compile(r"(\d{4}\.\d{4,5})")
+    __slots__ = ()
+
+    # arXiv ID 格式: 新式为 4位年份2位月份.5位序号 (如 2401.12345)，
+    # 旧式为 学科分类/7位数字 (如 cs/0112001、math.GT/0309136)；版本号不在捕获范围内
+    ARXIV_ID_PATTERN = re.compile(
+        r"(\d{4}\.\d{4,5}|(?<=/)[a-z\-]+(?:\.[A-Z]{2})?/\d{7})"
+    )
+    ABS_URL_PREFIX = "https://arxiv.org/abs/"
+    HOST_MARKERS = ("arxiv.org",)
 
     def can_process(self, url: str) -> bool:
         """检查是否是 arXiv 链接."""
@@ -158,17 +214,27 @@ class ArxivProcessor(URLProcessor):
             >>> processor.process("https://arxiv.org/abs/2401.12345")
             'https://arxiv.org/abs/2401.12345'
         """
+        # 已是规范的 Abstract 页面 URL，无需再做正则匹配
+        if self._is_canonical_abs_url(url):
+            return url
+
         try:
-            # 提取 arXiv ID
-            match = self.ARXIV_ID_PATTERN.search(url)
-            if not match:
-                logger.debug(f"无法从 URL 提取 arXiv ID: {url}")
-                return url
+            # 常见情况下 ID 就是路径最后一段（如 /pdf/2401.12345.pdf），先按字符串判断
+            path = url.partition("?")[0].partition("#")[0]
+            tail = path.rpartition("/")[2].removesuffix(".pdf")
+            if self._is_new_style_id(tail):
+                arxiv_id = tail
+            else:
+                # 提取 arXiv ID
+                match = self.ARXIV_ID_PATTERN.search(url)
+                if not match:
+                    logger.debug(f"无法从 URL 提取 arXiv ID: {url}")
+                    return url
 
-            arxiv_id = match.group(1)
+                arxiv_id = match.group(1)
 
             # 构建 Abstract 页面 URL
-            abs_url = f"https://arxiv.org/abs/{arxiv_id}"
+            abs_url = f"{self.ABS_URL_PREFIX}{arxiv_id}"
 
             if "/pdf/" in url:
                 logger.debug(f"将 arXiv PDF 转换为 Abstract: {url} -> {abs_url}")
@@ -181,20 +247,62 @@ class ArxivProcessor(URLProcessor):
             logger.warning(f"处理 arXiv URL 失败: {e}, url={url}")
             return url
 
+    def _is_canonical_abs_url(self, url: str) -> bool:
+        """检查是否已是 https://arxiv.org/abs/<新式 ID> 形式（不含版本号等后缀）."""
+        if not url.startswith(self.ABS_URL_PREFIX):
+            return False
+
+        return self._is_new_style_id(url[len(self.ABS_URL_PREFIX) :])
+
+    @staticmethod
+    def _is_new_style_id(value: str) -> bool:
+        """检查字符串是否恰好是新式 arXiv ID（如 2401.12345，不含版本号）."""
+        return (
+            len(value) in (9, 10)
+            and value[4] == "."
+            and value[:4].isdigit()
+            and value[5:].isdigit()
+        )
+
 
 class URLProcessorChain:
     """URL 处理器链.
 
     按顺序应用多个处理器,每个处理器决定是否处理 URL.
+    处理器的方法在构造和 add_processor 时预先绑定,processors 只读,
+    需通过 add_processor 添加处理器.
     """
 
+    __slots__ = ("_processors", "host_markers", "_bound")
+
     def __init__(self, processors: Optional[List[URLProcessor]] = None):
         """初始化处理器链.
 
         Args:
             processors: 处理器列表,按顺序执行.
         """
-        self.processors = processors or []
+        self._processors: Tuple[URLProcessor, ...] = tuple(processors or ())
+        self._bind()
+
+    @property
+    def processors(self) -> Tuple[URLProcessor, ...]:
+        """按执行顺序排列的处理器（只读）."""
+        return self._processors
+
+    def _bind(self) -> None:
+        """预先绑定各处理器的 can_process / process 方法，并汇总 HOST_MARKERS.
+
+        所有处理器都声明了 HOST_MARKERS 时,URL 不含其中任何一个子串即直接原样返回;
+        任一处理器未声明时不做快速判断.
+        """
+        self._bound = tuple((p.can_process, p.process) for p in self._processors)
+        markers: Tuple[str, ...] = ()
+        for processor in self._processors:
+            if processor.HOST_MARKERS is None:
+                self.host_markers = None
+                return
+            markers += processor.HOST_MARKERS
+        self.host_markers = markers
 
     def add_processor(self, processor: URLProcessor) -> "URLProcessorChain":
         """添加处理器到链尾.
@@ -205,7 +313,12 @@ class URLProcessorChain:
         Returns:
             self,支持链式调用.
         """
-        self.processors.append(processor)
+        self._processors += (processor,)
+        self._bind()
+        if self is default_processor_chain:
+            # 默认链变化后，按 URL 缓存的处理结果已失效
+            process_paper_url.cache_clear()
+            process_paper_url_with_metadata.cache_clear()
         return self
 
     def process(self, url: str) -> str:
@@ -219,19 +332,29 @@ class URLProcessorChain:
         Returns:
             处理后的 URL.
         """
-        original_url = url
+        if not self._may_process(url):
+            return url
+
         current_url = url
 
-        for processor in self.processors:
-            if processor.can_process(current_url):
-                current_url = processor.process(current_url)
+        for can_process, process in self._bound:
+            if can_process(current_url):
+                current_url = process(current_url)
                 logger.debug(
-                    f"{processor.__class__.__name__} 处理: "
-                    f"{original_url[:50]}... -> {current_url[:50]}..."
+                    f"{type(process.__self__).__name__} 处理: "
+                    f"{url[:50]}... -> {current_url[:50]}..."
                 )
 
         return current_url
 
+    def _may_process(self, url: str) -> bool:
+        """检查 URL 是否可能被链中的处理器处理."""
+        if self.host_markers is None:
+            return True
+
+        lowered = url.lower()
+        return any(marker in lowered for marker in self.host_markers)
+
     def process_with_metadata(self, url: str) -> ProcessedURL:
         """处理 URL 并保留标题提示.
 
@@ -241,10 +364,13 @@ class URLProcessorChain:
         Returns:
             处理后的 URL 信息.
         """
+        if not self._may_process(url):
+            return ProcessedURL(url=url)
+
         title_hint = ""
         current_url = url
 
-        for processor in self.processors:
+        for processor in self._processors:
             if isinstance(processor, GoogleScholarProcessor) and processor.can_process(
                 current_url
             ):
@@ -260,17 +386,16 @@ class URLProcessorChain:
 
 
 # 默认处理器链
-default_processor_chain = (
-    URLProcessorChain()
-    .add_processor(GoogleScholarProcessor())
-    .add_processor(ArxivProcessor())
+default_processor_chain = URLProcessorChain(
+    [GoogleScholarProcessor(), ArxivProcessor()]
 )
 
 
+@functools.lru_cache(maxsize=4096)
 def process_paper_url(url: str) -> str:
     """处理论文 URL.
 
-    使用默认处理器链处理 URL.
+    使用默认处理器链处理 URL，结果按原始 URL 缓存.
 
     Args:
         url: 原始论文 URL.
@@ -287,9 +412,12 @@ def process_paper_url(url: str) -> str:
     return default_processor_chain.process(url)
 
 
+@functools.lru_cache(maxsize=4096)
 def process_paper_url_with_metadata(url: str) -> ProcessedURL:
     """处理论文 URL 并保留元数据提示.
 
+    Scholar 邮件中同一原始链接经常重复出现，结果按原始 URL 缓存.
+
     Args:
         url: 原始论文 URL.
 
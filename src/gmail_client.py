@@ -4,23 +4,68 @@
 """
 
 import base64
+import importlib.util
 import logging
 import os
 import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any, Dict, List, Optional
 
+import lxml.html
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from lxml import etree
 
 from src.link_filters import extract_paper_links
 
 logger = logging.getLogger(__name__)
 
+# 可选使用 pybase64（SIMD 加速）解码邮件正文，接口与标准库一致
+if importlib.util.find_spec("pybase64") is not None:
+    from pybase64 import urlsafe_b64decode
+else:
+    from base64 import urlsafe_b64decode
+
+# HTML 标签，仅在 lxml 无法解析时兜底使用
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Gmail 建议单个 batch 不超过 50 个请求，否则容易触发限流
+GET_BATCH_SIZE = 50
+# users.messages.batchModify 单次最多 1000 个 ID
+MODIFY_BATCH_SIZE = 1000
+
+# 部分响应字段，只拉取解析邮件实际用到的数据
+LIST_FIELDS = "messages/id,nextPageToken"
+MESSAGE_FIELDS = (
+    "id,snippet,internalDate,"
+    "payload(headers(name,value),mimeType,body/data,parts(mimeType,body/data))"
+)
+
+
+def _html_to_text(html: str) -> str:
+    """提取 HTML 中的可见文本.
+
+    使用 lxml 解析，丢弃 script/style 和注释内容；解析失败时回退为正则去标签.
+
+    Args:
+        html: HTML 字符串.
+
+    Returns:
+        以空格分隔的文本内容.
+    """
+    try:
+        root = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return _HTML_TAG_RE.sub(" ", html)
+
+    etree.strip_elements(root, "script", "style", etree.Comment, with_tail=False)
+    return " ".join(root.itertext())
+
 
 class GmailClientError(Exception):
     """Gmail 客户端错误."""
@@ -28,6 +73,29 @@ class GmailClientError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class EmailRecord:
+    """解析后的邮件.
+
+    Attributes:
+        id: 邮件 ID.
+        subject: 邮件主题.
+        sender: 发件人.
+        snippet: 邮件摘要片段.
+        body: 邮件正文文本.
+        links: 正文中提取到的论文链接.
+        internal_date: 邮件接收时间（毫秒时间戳字符串）.
+    """
+
+    id: str
+    subject: str = ""
+    sender: str = ""
+    snippet: str = ""
+    body: str = ""
+    links: List[str] = field(default_factory=list)
+    internal_date: Optional[str] = None
+
+
 class GmailClient:
     """Gmail API 客户端.
 
@@ -117,7 +185,7 @@ class GmailClient:
         label: str = "scholar",
         max_results: int = 50,
         days_back: int = 7,
-    ) -> List[Dict]:
+    ) -> List[EmailRecord]:
         """获取指定标签下最近一段时间的未读邮件.
 
         Args:
@@ -126,7 +194,7 @@ class GmailClient:
             days_back: 处理最近几天的邮件（默认最近一周）.
 
         Returns:
-            邮件列表，每个邮件包含 id, subject, snippet, links 等.
+            EmailRecord 列表.
 
         Raises:
             GmailClientError: API 调用失败.
@@ -149,15 +217,24 @@ class GmailClient:
             results = (
                 self.service.users()
                 .messages()
-                .list(userId=self.user_id, q=query, maxResults=max_results)
+                .list(
+                    userId=self.user_id,
+                    q=query,
+                    maxResults=max_results,
+                    fields=LIST_FIELDS,
+                )
                 .execute()
             )
 
-            messages = results.get("messages", [])
-            emails = []
+            message_ids = [msg["id"] for msg in results.get("messages", [])]
+            raw_messages = self._batch_get_messages(message_ids)
 
-            for msg in messages:
-                email = self._get_email_details(msg["id"])
+            emails = []
+            for message_id in message_ids:
+                msg = raw_messages.get(message_id)
+                if msg is None:
+                    continue
+                email = self._get_email_details(message_id, msg)
                 if email:
                     emails.append(email)
 
@@ -169,32 +246,56 @@ class GmailClient:
         except HttpError as e:
             raise GmailClientError(f"获取邮件失败: {e}")
 
-    def _get_email_details(self, message_id: str) -> Optional[Dict]:
-        """获取邮件详细信息.
+    def _batch_get_messages(self, message_ids: List[str]) -> Dict[str, Dict]:
+        """通过 HTTP batch 请求批量获取邮件.
 
         Args:
-            message_id: 邮件 ID.
+            message_ids: 邮件 ID 列表.
 
         Returns:
-            邮件详情字典，失败返回 None.
+            邮件 ID 到原始邮件数据的映射，获取失败的邮件不包含在内.
         """
-        try:
-            msg = (
-                self.service.users()
-                .messages()
-                .get(userId=self.user_id, id=message_id)
-                .execute()
-            )
+        messages: Dict[str, Dict] = {}
+
+        def _collect(
+            request_id: str, response: Dict, exception: Optional[Exception]
+        ) -> None:
+            if exception is not None:
+                logger.error(f"获取邮件详情失败 {request_id}: {exception}")
+                return
+            messages[request_id] = response
+
+        # 资源对象在循环外取一次，避免每封邮件重复构建
+        messages_resource = self.service.users().messages()
+        for start in range(0, len(message_ids), GET_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for message_id in message_ids[start : start + GET_BATCH_SIZE]:
+                batch.add(
+                    messages_resource.get(
+                        userId=self.user_id, id=message_id, fields=MESSAGE_FIELDS
+                    ),
+                    request_id=message_id,
+                )
+            batch.execute()
+
+        return messages
+
+    def _get_email_details(self, message_id: str, msg: Dict) -> Optional[EmailRecord]:
+        """解析邮件详细信息.
 
-            headers = msg["payload"]["headers"]
-            subject = ""
-            sender = ""
+        Args:
+            message_id: 邮件 ID.
+            msg: Gmail API 返回的原始邮件数据.
 
-            for header in headers:
-                if header["name"] == "Subject":
-                    subject = header["value"]
-                elif header["name"] == "From":
-                    sender = header["value"]
+        Returns:
+            EmailRecord 对象，失败返回 None.
+        """
+        try:
+            headers = {
+                header["name"]: header["value"] for header in msg["payload"]["headers"]
+            }
+            subject = headers.get("Subject", "")
+            sender = headers.get("From", "")
 
             # 提取正文
             body = self._extract_body(msg["payload"])
@@ -202,18 +303,18 @@ class GmailClient:
             # 提取链接
             links = self._extract_links(body)
 
-            return {
-                "id": message_id,
-                "subject": subject,
-                "sender": sender,
-                "snippet": msg.get("snippet", ""),
-                "body": body,
-                "links": links,
-                "internalDate": msg.get("internalDate"),
-            }
+            return EmailRecord(
+                id=message_id,
+                subject=subject,
+                sender=sender,
+                snippet=msg.get("snippet", ""),
+                body=body,
+                links=links,
+                internal_date=msg.get("internalDate"),
+            )
 
         except Exception as e:
-            logger.error(f"获取邮件详情失败 {message_id}: {e}")
+            logger.error(f"解析邮件详情失败 {message_id}: {e}")
             return None
 
     def _extract_body(self, payload: Dict) -> str:
@@ -232,17 +333,16 @@ class GmailClient:
                 if part["mimeType"] == "text/plain":
                     data = part["body"].get("data", "")
                     if data:
-                        body += base64.urlsafe_b64decode(data).decode("utf-8")
+                        body += urlsafe_b64decode(data).decode("utf-8")
                 elif part["mimeType"] == "text/html":
                     data = part["body"].get("data", "")
                     if data:
-                        html = base64.urlsafe_b64decode(data).decode("utf-8")
-                        # 简单去除 HTML 标签
-                        body += re.sub(r"<[^>]+>", " ", html)
+                        html = urlsafe_b64decode(data).decode("utf-8")
+                        body += _html_to_text(html)
         else:
             data = payload["body"].get("data", "")
             if data:
-                body = base64.urlsafe_b64decode(data).decode("utf-8")
+                body = urlsafe_b64decode(data).decode("utf-8")
 
         return body
 
@@ -323,11 +423,19 @@ class GmailClient:
     def batch_mark_as_read(self, message_ids: List[str]) -> None:
         """批量标记邮件为已读.
 
+        使用 users.messages.batchModify，每 1000 个 ID 一次请求.
+
         Args:
             message_ids: 邮件 ID 列表.
         """
-        for msg_id in message_ids:
+        messages_resource = self.service.users().messages()
+        for start in range(0, len(message_ids), MODIFY_BATCH_SIZE):
+            chunk = message_ids[start : start + MODIFY_BATCH_SIZE]
             try:
-                self.mark_as_read(msg_id)
-            except GmailClientError as e:
-                logger.error(f"批量标记失败 {msg_id}: {e}")
+                messages_resource.batchModify(
+                    userId=self.user_id,
+                    body={"ids": chunk, "removeLabelIds": ["UNREAD"]},
+                ).execute()
+                logger.debug(f"批量标记 {len(chunk)} 封邮件为已读")
+            except HttpError as e:
+                logger.error(f"批量标记失败 {chunk}: {e}")
@@ -3,6 +3,7 @@
 提供从文本中提取论文链接的功能，并过滤掉非论文链接.
 """
 
+import functools
 import logging
 import re
 from abc import ABC, abstractmethod
@@ -61,9 +62,30 @@ class NonPaperLinkFilter(LinkFilter):
         r"ieeexplore\.ieee\.org/(abstract/)?document/",  # IEEE Xplore 论文
     ]
 
+    def __init__(self):
+        """初始化过滤器.
+
+        按实例的模式列表（含子类覆盖）各编译为单个交替正则，每个 URL 只需一次匹配，
+        判定结果按 URL 缓存. 构造后再修改模式列表不会生效.
+        """
+        self._non_paper_re = _compile_any(self.NON_PAPER_PATTERNS)
+        self._paper_re = _compile_any(self.PAPER_INDICATORS)
+        self._is_paper_link = functools.lru_cache(maxsize=4096)(self._check_url)
+
     def should_keep(self, url: str) -> bool:
         """判断是否为论文链接.
 
+        Args:
+            url: 待检查的 URL.
+
+        Returns:
+            True 如果是论文链接，False 如果不是.
+        """
+        return self._is_paper_link(url)
+
+    def _check_url(self, url: str) -> bool:
+        """判定逻辑，结果由 should_keep 按 URL 缓存.
+
         Args:
             url: 待检查的 URL.
 
@@ -73,26 +95,26 @@ class NonPaperLinkFilter(LinkFilter):
         url = html_unescape(url)
 
         # 首先检查是否包含非论文特征
-        for pattern in self.NON_PAPER_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                logger.debug(f"过滤非论文链接: {url[:60]}... (匹配: {pattern})")
-                return False
+        match = self._non_paper_re.search(url)
+        if match:
+            logger.debug(f"过滤非论文链接: {url[:60]}... (匹配: {match.group(0)})")
+            return False
 
         # Google Scholar 包装链接需要检查目标 URL，避免保留 cleardot.gif 等资源。
         scholar_target = self._extract_scholar_target(url)
         if scholar_target:
-            return self.should_keep(scholar_target)
+            return self._is_paper_link(scholar_target)
 
         # 然后检查是否包含论文特征
-        for pattern in self.PAPER_INDICATORS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
+        if self._paper_re.search(url):
+            return True
 
         # 默认过滤掉（保守策略）
         logger.debug(f"过滤未知链接: {url[:60]}...")
         return False
 
-    def _extract_scholar_target(self, url: str) -> str:
+    @staticmethod
+    def _extract_scholar_target(url: str) -> str:
         """提取 Google Scholar 重定向目标 URL.
 
         Args:
@@ -115,14 +137,27 @@ class NonPaperLinkFilter(LinkFilter):
         return unquote(query_params["url"][0])
 
 
+def _compile_any(patterns: List[str]) -> "re.Pattern[str]":
+    """将多个模式合并为一个忽略大小写的交替正则.
+
+    Args:
+        patterns: 正则模式列表.
+
+    Returns:
+        编译后的正则.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
 class LinkExtractor:
     """链接提取器.
 
     从文本中提取 URL，并应用过滤器筛选论文链接.
     """
 
-    # URL 匹配正则表达式
-    URL_PATTERN = r"https?://[^\s<>\"{}|\\^`\[\]]+"
+    # URL 匹配正则表达式，末尾的标点不计入 URL
+    URL_PATTERN = r"https?://[^\s<>\"{}|\\^`\[\]]*[^\s<>\"{}|\\^`\[\].,;:!?)]"
+    _URL_RE = re.compile(URL_PATTERN)
 
     def __init__(self, filters: Optional[List[LinkFilter]] = None):
         """初始化链接提取器.
@@ -139,30 +174,27 @@ class LinkExtractor:
             text: 文本内容.
 
         Returns:
-            过滤后的 URL 列表.
+            过滤后的 URL 列表，按首次出现的顺序排列.
         """
-        # 提取所有 URL
-        urls = re.findall(self.URL_PATTERN, text)
+        seen: Set[str] = set()
+        filtered_urls = []
+        total = 0
 
-        # 清理和去重
-        cleaned_urls: Set[str] = set()
-        for url in urls:
-            # 去除末尾的标点
-            url = html_unescape(url.rstrip(".,;:!?)"))
-            cleaned_urls.add(url)
+        # 单次扫描完成提取、去重和过滤（正则已排除末尾标点）
+        for match in self._URL_RE.finditer(text):
+            total += 1
+            url = html_unescape(match.group())
+            if url in seen:
+                continue
+            seen.add(url)
 
-        # 应用过滤器
-        filtered_urls = []
-        for url in cleaned_urls:
             # 必须通过所有过滤器
             if all(f.should_keep(url) for f in self.filters):
                 filtered_urls.append(url)
             else:
                 logger.debug(f"链接被过滤: {url[:60]}...")
 
-        logger.info(
-            f"从文本提取到 {len(urls)} 个链接，过滤后剩余 {len(filtered_urls)} 个"
-        )
+        logger.info(f"从文本提取到 {total} 个链接，过滤后剩余 {len(filtered_urls)} 个")
         return filtered_urls
 
 
@@ -3,13 +3,19 @@
 定义 LLM 服务提供商的统一接口.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class SummaryResult:
     """摘要结果数据结构."""
 
+    __slots__ = ("summary", "background", "method", "results", "relevance_score")
+
     def __init__(
         self,
         summary: str,
@@ -66,6 +72,50 @@ class LLMProvider(ABC):
         """
         pass
 
+    def summarize_batch(
+        self, items: List[Tuple[str, str]], concurrency: int = 8
+    ) -> List[Optional[SummaryResult]]:
+        """批量生成多篇论文的摘要.
+
+        默认实现用线程池并发调用 summarize，子类可覆盖为原生的并发或批处理接口.
+
+        Args:
+            items: (标题, 摘要) 列表.
+            concurrency: 最大并发请求数.
+
+        Returns:
+            与输入顺序一致的摘要列表，失败的条目为 None.
+        """
+        if not items:
+            return []
+
+        def _one(item: Tuple[str, str]) -> Optional[SummaryResult]:
+            title, abstract = item
+            try:
+                return self.summarize(title, abstract)
+            except LLMError as e:
+                logger.error(f"生成摘要失败: {title} - {e}")
+                return None
+            except Exception as e:
+                logger.error(f"生成摘要时发生未知错误: {title} - {e}")
+                return None
+
+        workers = min(max(1, concurrency), len(items))
+        if workers == 1:
+            return [_one(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_one, items))
+
+    def cache_fingerprint(self) -> str:
+        """返回影响摘要输出的配置指纹，用于区分摘要缓存.
+
+        默认只区分 Provider 类型，子类应加入模型、生成参数和 Prompt 等配置.
+
+        Returns:
+            配置指纹字符串.
+        """
+        return type(self).__name__
+
     @abstractmethod
     def is_available(self) -> bool:
         """检查 Provider 是否可用.
@@ -5,6 +5,7 @@
 安装: pip install google-generativeai
 """
 
+import importlib.util
 import logging
 import os
 from typing import TYPE_CHECKING
@@ -44,17 +45,22 @@ class GeminiProvider(LLMProvider):
         self._genai_available = self._check_genai()
 
     def _check_genai(self) -> bool:
-        """检查 google-generativeai 是否已安装."""
-        try:
-            import google.generativeai as genai  # noqa: F401
+        """检查 google-generativeai 是否已安装.
 
-            return True
-        except ImportError:
-            logger.warning(
-                "google-generativeai 未安装，无法使用 GeminiProvider. "
-                "运行: pip install google-generativeai"
-            )
-            return False
+        仅查找模块规格，不实际导入，真正使用时再在 _get_client 中导入.
+        """
+        try:
+            if importlib.util.find_spec("google.generativeai") is not None:
+                return True
+        except ModuleNotFoundError:
+            # 父包 google 不存在
+            pass
+
+        logger.warning(
+            "google-generativeai 未安装，无法使用 GeminiProvider. "
+            "运行: pip install google-generativeai"
+        )
+        return False
 
     def is_available(self) -> bool:
         """检查 Provider 是否可用.
@@ -5,19 +5,30 @@
 - OPENAI_API_KEY: API 密钥
 - OPENAI_BASE_URL: Base URL（可选，默认 https://api.openai.com/v1）
 - OPENAI_MODEL: 模型名称（可选，默认 gpt-4o-mini）
+- LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE: 主动限流（可选，默认不限制）
 """
 
+import asyncio
+import importlib.util
 import json
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from .base import LLMError, LLMProvider, SummaryResult
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# 可选使用 orjson 加速 JSON 解析，其 JSONDecodeError 是 json.JSONDecodeError 的子类
+if importlib.util.find_spec("orjson") is not None:
+    from orjson import loads as _json_loads
+else:
+    _json_loads = json.loads
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI 兼容接口 Provider.
@@ -26,6 +37,8 @@ class OpenAIProvider(LLMProvider):
         OPENAI_API_KEY: 必需，API 密钥
         OPENAI_BASE_URL: 可选，默认 https://api.openai.com/v1
         OPENAI_MODEL: 可选，默认 gpt-4o-mini
+        LLM_REQUESTS_PER_MINUTE: 可选，每分钟最大请求数，默认不限制
+        LLM_TOKENS_PER_MINUTE: 可选，每分钟最大 token 数，默认不限制
 
     示例:
         # 标准 OpenAI
@@ -48,8 +61,14 @@ class OpenAIProvider(LLMProvider):
         self.model = os.getenv("OPENAI_MODEL", self.DEFAULT_MODEL)
         self.temperature = float(os.getenv("LLM_TEMPERATURE", "0.3"))
         self.max_tokens = int(os.getenv("LLM_MAX_TOKENS", "1000"))
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=float(os.getenv("LLM_REQUESTS_PER_MINUTE", "0")),
+            tokens_per_minute=float(os.getenv("LLM_TOKENS_PER_MINUTE", "0")),
+        )
 
         self._client: Optional[OpenAI] = None
+        self._aclient: Optional[AsyncOpenAI] = None
+        self._client_lock = threading.Lock()
 
     def is_available(self) -> bool:
         """检查 Provider 是否可用.
@@ -62,6 +81,9 @@ class OpenAIProvider(LLMProvider):
     def _get_client(self) -> OpenAI:
         """获取或创建 OpenAI 客户端.
 
+        客户端内部持有 HTTP 连接池（默认启用 keep-alive），所有 summarize 调用
+        共用同一个实例；并发首次调用时加锁，避免各线程各建一个连接池.
+
         Returns:
             OpenAI 客户端.
 
@@ -72,13 +94,40 @@ class OpenAIProvider(LLMProvider):
             raise LLMError("OPENAI_API_KEY 未配置，请在 GitHub Secrets 中设置")
 
         if self._client is None:
-            self._client = OpenAI(
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                    )
+                    logger.debug(
+                        f"OpenAI 客户端已创建: {self.base_url}, model={self.model}"
+                    )
+
+        return self._client
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """获取或创建异步 OpenAI 客户端.
+
+        Returns:
+            AsyncOpenAI 客户端.
+
+        Raises:
+            LLMError: API 密钥未配置.
+        """
+        if not self.is_available():
+            raise LLMError("OPENAI_API_KEY 未配置，请在 GitHub Secrets 中设置")
+
+        if self._aclient is None:
+            self._aclient = AsyncOpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
             )
-            logger.debug(f"OpenAI 客户端已创建: {self.base_url}, model={self.model}")
+            logger.debug(
+                f"AsyncOpenAI 客户端已创建: {self.base_url}, model={self.model}"
+            )
 
-        return self._client
+        return self._aclient
 
     def summarize(self, title: str, abstract: str) -> SummaryResult:
         """生成论文中文摘要.
@@ -96,20 +145,44 @@ class OpenAIProvider(LLMProvider):
         client = self._get_client()
 
         prompt = self._build_prompt(title, abstract)
+        self.rate_limiter.acquire(self._estimate_tokens(prompt))
 
         try:
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "你是一位学术研究助手，擅长分析和总结学术论文。",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"},
+            response = client.chat.completions.create(**self._completion_kwargs(prompt))
+
+            content = response.choices[0].message.content
+            if content is None:
+                raise LLMError("OpenAI API 返回空内容")
+            return self._parse_response(content)  # type: ignore
+
+        except Exception as e:
+            logger.error(f"OpenAI API 调用失败: {e}")
+            raise LLMError(f"生成摘要失败: {e}")
+
+    async def asummarize(self, title: str, abstract: str) -> SummaryResult:
+        """异步生成论文中文摘要.
+
+        Args:
+            title: 论文标题.
+            abstract: 论文摘要.
+
+        Returns:
+            SummaryResult 对象.
+
+        Raises:
+            LLMError: API 调用失败.
+        """
+        client = self._get_async_client()
+
+        prompt = self._build_prompt(title, abstract)
+        # 限流器会阻塞等待，放到线程中执行以免阻塞事件循环
+        await asyncio.to_thread(
+            self.rate_limiter.acquire, self._estimate_tokens(prompt)
+        )
+
+        try:
+            response = await client.chat.completions.create(
+                **self._completion_kwargs(prompt)
             )
 
             content = response.choices[0].message.content
@@ -121,6 +194,109 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"OpenAI API 调用失败: {e}")
             raise LLMError(f"生成摘要失败: {e}")
 
+    async def summarize_many(
+        self, items: List[Tuple[str, str]], concurrency: int = 8
+    ) -> List[Optional[SummaryResult]]:
+        """并发生成多篇论文的摘要.
+
+        Args:
+            items: (标题, 摘要) 列表.
+            concurrency: 最大并发请求数.
+
+        Returns:
+            与输入顺序一致的摘要列表，失败的条目为 None.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _bounded(title: str, abstract: str) -> Optional[SummaryResult]:
+            async with semaphore:
+                try:
+                    return await self.asummarize(title, abstract)
+                except LLMError as e:
+                    logger.error(f"生成摘要失败: {title} - {e}")
+                    return None
+                except Exception as e:
+                    logger.error(f"生成摘要时发生未知错误: {title} - {e}")
+                    return None
+
+        return list(
+            await asyncio.gather(
+                *(_bounded(title, abstract) for title, abstract in items)
+            )
+        )
+
+    def summarize_batch(
+        self, items: List[Tuple[str, str]], concurrency: int = 8
+    ) -> List[Optional[SummaryResult]]:
+        """批量生成摘要，在独立事件循环中通过 AsyncOpenAI 并发请求.
+
+        Args:
+            items: (标题, 摘要) 列表.
+            concurrency: 最大并发请求数.
+
+        Returns:
+            与输入顺序一致的摘要列表，失败的条目为 None.
+        """
+        if not items:
+            return []
+
+        async def _run() -> List[Optional[SummaryResult]]:
+            try:
+                return await self.summarize_many(items, concurrency)
+            finally:
+                # 异步客户端的连接池绑定在当前事件循环上，循环结束前关闭
+                if self._aclient is not None:
+                    await self._aclient.close()
+                    self._aclient = None
+
+        return asyncio.run(_run())
+
+    def cache_fingerprint(self) -> str:
+        """返回影响摘要输出的配置指纹.
+
+        基于以占位符构建的完整请求参数，模型、temperature、max_tokens
+        或 Prompt 模板变化时指纹随之变化.
+
+        Returns:
+            配置指纹字符串.
+        """
+        kwargs = self._completion_kwargs(self._build_prompt("{title}", "{abstract}"))
+        return json.dumps(kwargs, ensure_ascii=False, sort_keys=True)
+
+    def _estimate_tokens(self, prompt: str) -> int:
+        """粗略估算单次请求消耗的 token：输入按 4 字符/token，加上输出上限.
+
+        Args:
+            prompt: Prompt 字符串.
+
+        Returns:
+            预估 token 数.
+        """
+        return len(prompt) // 4 + self.max_tokens
+
+    def _completion_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """构建 chat.completions.create 的请求参数.
+
+        Args:
+            prompt: Prompt 字符串.
+
+        Returns:
+            请求参数字典.
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "你是一位学术研究助手，擅长分析和总结学术论文。",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "response_format": {"type": "json_object"},
+        }
+
     def _build_prompt(self, title: str, abstract: str) -> str:
         """构建 Prompt.
 
@@ -162,7 +338,7 @@ class OpenAIProvider(LLMProvider):
             LLMError: 解析失败.
         """
         try:
-            data = json.loads(content)
+            data = _json_loads(content)
 
             return SummaryResult(
                 summary=data.get("summary", ""),
@@ -0,0 +1,113 @@
+"""LLM 调用限流器.
+
+基于令牌桶同时限制每分钟请求数（RPM）和 token 数（TPM），
+在并发调用 LLM 时主动等待，避免触发服务端 429 限流.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class _Bucket:
+    """按每分钟容量匀速补充的令牌桶."""
+
+    def __init__(self, per_minute: float, now: float, min_capacity: float = 0.0):
+        """初始化令牌桶，初始为满.
+
+        Args:
+            per_minute: 每分钟补充的令牌数.
+            now: 当前时间.
+            min_capacity: 桶容量下限，保证单次取用的数量不超过容量.
+        """
+        self.capacity = max(float(per_minute), min_capacity)
+        self.rate = float(per_minute) / 60.0
+        self.available = self.capacity
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        """按流逝时间补充令牌."""
+        elapsed = now - self.updated_at
+        self.available = min(self.capacity, self.available + elapsed * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """计算取得指定数量令牌需要等待的秒数."""
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+
+class RateLimiter:
+    """线程安全的 RPM/TPM 限流器.
+
+    limit 为 0 或负数表示不限制对应维度.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """初始化限流器.
+
+        Args:
+            requests_per_minute: 每分钟最大请求数.
+            tokens_per_minute: 每分钟最大 token 数.
+            clock: 单调时钟函数，便于测试替换.
+            sleep: 休眠函数，便于测试替换.
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        now = clock()
+        # 每次请求消耗 1 个令牌，RPM 小于 1 时容量至少为 1，否则永远取不到
+        self._requests = (
+            _Bucket(requests_per_minute, now, min_capacity=1.0)
+            if requests_per_minute > 0
+            else None
+        )
+        self._tokens = (
+            _Bucket(tokens_per_minute, now) if tokens_per_minute > 0 else None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """是否启用了任一维度的限流."""
+        return self._requests is not None or self._tokens is not None
+
+    def acquire(self, tokens: int = 0) -> None:
+        """阻塞直到可以发出一次请求.
+
+        Args:
+            tokens: 本次请求预估消耗的 token 数，超过桶容量时按容量计.
+        """
+        if not self.enabled:
+            return
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = 0.0
+
+                if self._requests is not None:
+                    self._requests.refill(now)
+                    wait = max(wait, self._requests.wait_time(1))
+
+                token_cost = 0.0
+                if self._tokens is not None:
+                    self._tokens.refill(now)
+                    token_cost = min(float(tokens), self._tokens.capacity)
+                    wait = max(wait, self._tokens.wait_time(token_cost))
+
+                if wait <= 0:
+                    if self._requests is not None:
+                        self._requests.available -= 1
+                    if self._tokens is not None:
+                        self._tokens.available -= token_cost
+                    return
+
+            self._sleep(wait)
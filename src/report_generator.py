@@ -5,12 +5,97 @@
 
 import logging
 from datetime import datetime
+from html import escape
 from typing import Dict, List, Optional
 
 from src.config import ReportConfig
 
 logger = logging.getLogger(__name__)
 
+# HTML 模板在模块加载时定义一次，渲染时只做 str.format 替换；
+# 所有插入的论文字段都先经过 html.escape 转义
+_HTML_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>学术周报 - {date}</title>
+{styles}
+</head>
+<body>
+<h1>学术周报 - {date}</h1>
+<p class="summary">本周共处理 <strong>{count}</strong> 篇论文</p>
+<div class="papers">
+{papers}
+</div>
+</body>
+</html>"""
+
+_HTML_PAPER_TEMPLATE = """<div class="paper">
+<h3>{index}. <a href="{url}">{title}</a></h3>
+{sections}</div>"""
+
+_HTML_SECTION_TEMPLATE = '<p class="{css_class}">{content}</p>\n'
+
+# HTML 样式是固定内容，定义为常量避免每次生成报告时重新构造
+_HTML_STYLES = """<style>
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+    line-height: 1.6;
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 20px;
+    color: #333;
+}
+h1 {
+    color: #2c3e50;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 10px;
+}
+h3 {
+    color: #34495e;
+    margin-top: 30px;
+}
+.paper {
+    background: #f8f9fa;
+    border-left: 4px solid #3498db;
+    padding: 15px;
+    margin: 20px 0;
+    border-radius: 4px;
+}
+.paper h3 {
+    margin-top: 0;
+}
+.paper h3 a {
+    color: #2980b9;
+    text-decoration: none;
+}
+.paper h3 a:hover {
+    text-decoration: underline;
+}
+.authors {
+    color: #666;
+    font-style: italic;
+}
+.meta {
+    color: #888;
+    font-size: 0.9em;
+}
+.score {
+    color: #e74c3c;
+    font-weight: bold;
+}
+.summary {
+    font-size: 1.1em;
+    margin: 20px 0;
+}
+.footer {
+    color: #999;
+    font-size: 0.9em;
+    text-align: center;
+    margin-top: 40px;
+}
+</style>"""
+
 
 class ReportGenerator:
     """报告生成器.
@@ -18,6 +103,14 @@ class ReportGenerator:
     生成格式化的学术周报.
     """
 
+    # LLM 摘要段落: (字段名/CSS 类名, 图标, 标签)，按顺序输出，值为空时跳过
+    SUMMARY_SECTIONS = (
+        ("summary", "📋", "一句话总结"),
+        ("background", "🔍", "研究背景"),
+        ("method", "💡", "核心方法"),
+        ("results", "📊", "主要结果"),
+    )
+
     def __init__(self, config: Optional[ReportConfig] = None):
         """初始化报告生成器.
 
@@ -35,29 +128,20 @@ class ReportGenerator:
         Returns:
             Markdown 格式报告.
         """
-        if not papers:
-            return self._generate_empty_report()
-
-        lines = []
-
-        # 标题
         date_str = datetime.now().strftime("%Y-%m-%d")
-        lines.append(f"# 学术周报 - {date_str}")
-        lines.append("")
-
-        # 统计信息
-        lines.append(f"本周共处理 **{len(papers)}** 篇论文")
-        lines.append("")
-
-        # 论文列表
-        lines.append("## 论文列表")
-        lines.append("")
+        if not papers:
+            return self._generate_empty_report(date_str)
 
-        for i, paper in enumerate(papers, 1):
-            lines.append(self._format_paper_markdown(i, paper))
-            lines.append("")
+        papers_md = "\n\n".join(
+            self._format_paper_markdown(i, paper) for i, paper in enumerate(papers, 1)
+        )
 
-        return "\n".join(lines)
+        return (
+            f"# 学术周报 - {date_str}\n\n"
+            f"本周共处理 **{len(papers)}** 篇论文\n\n"
+            f"## 论文列表\n\n"
+            f"{papers_md}\n"
+        )
 
     def generate_html(self, papers: List[Dict]) -> str:
         """生成 HTML 格式报告.
@@ -68,38 +152,19 @@ class ReportGenerator:
         Returns:
             HTML 格式报告.
         """
-        if not papers:
-            return self._generate_empty_html_report()
-
         date_str = datetime.now().strftime("%Y-%m-%d")
-
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            '<meta charset="UTF-8">',
-            f"<title>学术周报 - {date_str}</title>",
-            self._get_html_styles(),
-            "</head>",
-            "<body>",
-            f"<h1>学术周报 - {date_str}</h1>",
-            f'<p class="summary">本周共处理 <strong>{len(papers)}</strong> 篇论文</p>',
-            '<div class="papers">',
-        ]
-
-        for i, paper in enumerate(papers, 1):
-            html_parts.append(self._format_paper_html(i, paper))
-
-        html_parts.extend(
-            [
-                "</div>",
-                "</body>",
-                "</html>",
-            ]
+        if not papers:
+            return self._generate_empty_html_report(date_str)
+
+        return _HTML_REPORT_TEMPLATE.format(
+            date=date_str,
+            styles=_HTML_STYLES,
+            count=len(papers),
+            papers="\n".join(
+                self._format_paper_html(i, paper) for i, paper in enumerate(papers, 1)
+            ),
         )
 
-        return "\n".join(html_parts)
-
     def _format_paper_markdown(self, index: int, paper: Dict) -> str:
         """格式化单篇论文为 Markdown.
 
@@ -110,64 +175,28 @@ class ReportGenerator:
         Returns:
             Markdown 字符串.
         """
-        lines = []
-
-        # 标题和链接
         title = paper.get("title", "未知标题")
         url = paper.get("url", "")
-        lines.append(f"### {index}. [{title}]({url})")
-        lines.append("")
-
-        # 作者
         authors = paper.get("authors", [])
-        if authors:
-            authors_str = ", ".join(authors)
-            lines.append(f"**作者**: {authors_str}")
-            lines.append("")
-
-        # 年份和 venue
-        year = paper.get("year", "")
-        venue = paper.get("venue", "")
-        if year or venue:
-            meta_parts = []
-            if year:
-                meta_parts.append(f"年份: {year}")
-            if venue:
-                meta_parts.append(f"发表: {venue}")
-            lines.append(f"**{', '.join(meta_parts)}**")
-            lines.append("")
-
-        # 一句话总结
-        summary = paper.get("summary", "")
-        if summary:
-            lines.append(f"📋 **一句话总结**: {summary}")
-            lines.append("")
-
-        # 研究背景
-        background = paper.get("background", "")
-        if background:
-            lines.append(f"🔍 **研究背景**: {background}")
-            lines.append("")
-
-        # 核心方法
-        method = paper.get("method", "")
-        if method:
-            lines.append(f"💡 **核心方法**: {method}")
-            lines.append("")
-
-        # 主要结果
-        results = paper.get("results", "")
-        if results:
-            lines.append(f"📊 **主要结果**: {results}")
-            lines.append("")
+        meta = self._format_meta(paper)
+        score = paper.get("relevance_score")
 
+        # 每个可选段落自带结尾空行，缺失时为空字符串
+        authors_md = f"**作者**: {', '.join(authors)}\n\n" if authors else ""
+        meta_md = f"**{meta}**\n\n" if meta else ""
+        sections_md = "".join(
+            f"{icon} **{label}**: {value}\n\n"
+            for key, icon, label in self.SUMMARY_SECTIONS
+            if (value := paper.get(key))
+        )
         # 相关度评分（仅在启用时显示）
-        score = paper.get("relevance_score")
-        if score is not None:
-            lines.append(f"⭐ **相关度评分**: {score}/10")
-            lines.append("")
+        score_md = f"⭐ **相关度评分**: {score}/10\n\n" if score is not None else ""
 
-        return "\n".join(lines)
+        # 最后一段只保留一个换行
+        return (
+            f"### {index}. [{title}]({url})\n\n"
+            f"{authors_md}{meta_md}{sections_md}{score_md}"
+        )[:-1]
 
     def _format_paper_html(self, index: int, paper: Dict) -> str:
         """格式化单篇论文为 HTML.
@@ -177,71 +206,74 @@ class ReportGenerator:
             paper: 论文数据.
 
         Returns:
-            HTML 字符串.
+            HTML 字符串，论文字段均已转义.
         """
         title = paper.get("title", "未知标题")
         url = paper.get("url", "#")
         authors = ", ".join(paper.get("authors", []))
-        year = paper.get("year", "")
-        venue = paper.get("venue", "")
-        summary = paper.get("summary", "")
-        background = paper.get("background", "")
-        method = paper.get("method", "")
-        results = paper.get("results", "")
+        meta = self._format_meta(paper)
         score = paper.get("relevance_score")
 
-        html_parts = [
-            '<div class="paper">',
-            f'<h3>{index}. <a href="{url}">{title}</a></h3>',
-        ]
+        sections = ""
 
         if authors:
-            html_parts.append(
-                f'<p class="authors"><strong>作者:</strong> {authors}</p>'
+            sections += _HTML_SECTION_TEMPLATE.format(
+                css_class="authors",
+                content=f"<strong>作者:</strong> {escape(authors)}",
             )
 
-        meta_parts = []
-        if year:
-            meta_parts.append(f"年份: {year}")
-        if venue:
-            meta_parts.append(f"发表: {venue}")
-        if meta_parts:
-            html_parts.append(
-                f'<p class="meta"><strong>{", ".join(meta_parts)}</strong></p>'
+        if meta:
+            sections += _HTML_SECTION_TEMPLATE.format(
+                css_class="meta",
+                content=f"<strong>{escape(meta)}</strong>",
             )
 
-        if summary:
-            html_parts.append(
-                f'<p class="summary">📋 <strong>一句话总结:</strong> {summary}</p>'
+        sections += "".join(
+            _HTML_SECTION_TEMPLATE.format(
+                css_class=key,
+                content=f"{icon} <strong>{label}:</strong> {escape(value)}",
             )
+            for key, icon, label in self.SUMMARY_SECTIONS
+            if (value := paper.get(key))
+        )
 
-        if background:
-            html_parts.append(
-                f'<p class="background">🔍 <strong>研究背景:</strong> {background}</p>'
+        if score is not None:
+            sections += _HTML_SECTION_TEMPLATE.format(
+                css_class="score",
+                content=f"⭐ <strong>相关度评分:</strong> {score}/10",
             )
 
-        if method:
-            html_parts.append(
-                f'<p class="method">💡 <strong>核心方法:</strong> {method}</p>'
-            )
+        return _HTML_PAPER_TEMPLATE.format(
+            index=index,
+            url=escape(url),
+            title=escape(title),
+            sections=sections,
+        )
 
-        if results:
-            html_parts.append(
-                f'<p class="results">📊 <strong>主要结果:</strong> {results}</p>'
-            )
+    @staticmethod
+    def _format_meta(paper: Dict) -> str:
+        """格式化年份和发表信息.
 
-        if score is not None:
-            html_parts.append(
-                f'<p class="score">⭐ <strong>相关度评分:</strong> {score}/10</p>'
-            )
+        Args:
+            paper: 论文数据.
 
-        html_parts.append("</div>")
+        Returns:
+            如 "年份: 2024, 发表: NeurIPS"，均缺失时为空字符串.
+        """
+        meta_parts = []
+        if year := paper.get("year", ""):
+            meta_parts.append(f"年份: {year}")
+        if venue := paper.get("venue", ""):
+            meta_parts.append(f"发表: {venue}")
+        return ", ".join(meta_parts)
 
-        return "\n".join(html_parts)
+    def _generate_empty_report(self, date_str: Optional[str] = None) -> str:
+        """生成空报告.
 
-    def _generate_empty_report(self) -> str:
-        """生成空报告."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        Args:
+            date_str: 报告日期，默认为当天.
+        """
+        date_str = date_str or datetime.now().strftime("%Y-%m-%d")
         return f"""# 学术周报 - {date_str}
 
 本周没有新论文需要处理。
@@ -251,15 +283,19 @@ class ReportGenerator:
 *此报告由 Gmail Scholar Summary 自动生成*
 """
 
-    def _generate_empty_html_report(self) -> str:
-        """生成空 HTML 报告."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
+    def _generate_empty_html_report(self, date_str: Optional[str] = None) -> str:
+        """生成空 HTML 报告.
+
+        Args:
+            date_str: 报告日期，默认为当天.
+        """
+        date_str = date_str or datetime.now().strftime("%Y-%m-%d")
         return f"""<!DOCTYPE html>
 <html>
 <head>
 <meta charset="UTF-8">
 <title>学术周报 - {date_str}</title>
-{self._get_html_styles()}
+{_HTML_STYLES}
 </head>
 <body>
 <h1>学术周报 - {date_str}</h1>
@@ -269,64 +305,3 @@ class ReportGenerator:
 </body>
 </html>
 """
-
-    def _get_html_styles(self) -> str:
-        """获取 HTML 样式."""
-        return """<style>
-body {
-    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-    line-height: 1.6;
-    max-width: 800px;
-    margin: 0 auto;
-    padding: 20px;
-    color: #333;
-}
-h1 {
-    color: #2c3e50;
-    border-bottom: 2px solid #3498db;
-    padding-bottom: 10px;
-}
-h3 {
-    color: #34495e;
-    margin-top: 30px;
-}
-.paper {
-    background: #f8f9fa;
-    border-left: 4px solid #3498db;
-    padding: 15px;
-    margin: 20px 0;
-    border-radius: 4px;
-}
-.paper h3 {
-    margin-top: 0;
-}
-.paper h3 a {
-    color: #2980b9;
-    text-decoration: none;
-}
-.paper h3 a:hover {
-    text-decoration: underline;
-}
-.authors {
-    color: #666;
-    font-style: italic;
-}
-.meta {
-    color: #888;
-    font-size: 0.9em;
-}
-.score {
-    color: #e74c3c;
-    font-weight: bold;
-}
-.summary {
-    font-size: 1.1em;
-    margin: 20px 0;
-}
-.footer {
-    color: #999;
-    font-size: 0.9em;
-    text-align: center;
-    margin-top: 40px;
-}
-</style>"""
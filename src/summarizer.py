@@ -4,17 +4,36 @@
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
-from src.fetchers import PaperFetchError, PaperFetcher
+from src.fetchers import PaperFetchError, PaperFetcher, PaperInfo
+from src.fetchers.cache import DiskCache
 from src.fetchers.composite_fetcher import CompositeFetcher
 from src.fetchers.html_metadata import is_blocked_text
-from src.fetchers.url_processors import ProcessedURL
-from src.llm_providers import LLMError, LLMProvider
+from src.fetchers.url_processors import ProcessedURL, process_paper_url
+from src.llm_providers import LLMError, LLMProvider, SummaryResult
 from src.llm_providers.openai_provider import OpenAIProvider
 
 logger = logging.getLogger(__name__)
 
+_NON_WORD_RE = re.compile(r"\W+")
+# 参与摘要缓存键计算的摘要前缀长度
+_ABSTRACT_KEY_CHARS = 1024
+
+
+def _result_key(url: Union[str, ProcessedURL]) -> str:
+    """生成结果记忆与去重使用的键.
+
+    Args:
+        url: 论文页面 URL 或已处理 URL.
+
+    Returns:
+        规范化后的 URL.
+    """
+    return url.url if isinstance(url, ProcessedURL) else process_paper_url(url)
+
 
 class SummarizerError(Exception):
     """摘要器错误."""
@@ -32,18 +51,26 @@ class PaperSummarizer:
         self,
         fetcher: Optional[PaperFetcher] = None,
         llm_provider: Optional[LLMProvider] = None,
+        max_workers: int = 8,
+        summary_cache: Optional[DiskCache] = None,
     ):
         """初始化摘要器.
 
         Args:
             fetcher: 论文获取器，默认使用 CompositeFetcher.
             llm_provider: LLM Provider，默认使用 OpenAIProvider.
+            max_workers: 批量处理时的最大并发数，1 表示串行处理.
+            summary_cache: LLM 摘要缓存，None 表示不使用缓存.
 
         Raises:
             SummarizerError: 初始化失败.
         """
         self.fetcher = fetcher or CompositeFetcher()
         self.llm_provider = llm_provider or OpenAIProvider()
+        self.max_workers = max(1, max_workers)
+        self.summary_cache = summary_cache
+        # 本次运行内已成功处理的结果，按规范化后的 URL 记忆
+        self._results: Dict[str, Dict] = {}
 
         # 检查 LLM Provider 是否可用
         if not self.llm_provider.is_available():
@@ -52,6 +79,9 @@ class PaperSummarizer:
     def process_url(self, url: Union[str, ProcessedURL]) -> Optional[Dict]:
         """处理单个 URL，获取论文信息并生成摘要.
 
+        同一 URL 成功处理后会记住结果，再次处理时直接返回副本；
+        失败的 URL 不记忆，便于重试.
+
         Args:
             url: 论文页面 URL 或已处理 URL.
 
@@ -59,10 +89,40 @@ class PaperSummarizer:
             包含论文信息和摘要的字典，失败返回 None.
         """
         log_url = url.url if isinstance(url, ProcessedURL) else url
+        cached = self._results.get(_result_key(url))
+        if cached is not None:
+            logger.debug(f"复用已处理结果: {log_url}")
+            return dict(cached)
+
+        paper_info = self._fetch_paper(url)
+        if paper_info is None:
+            return None
+
+        try:
+            summary = self._summarize(paper_info.title, paper_info.abstract)
+            logger.debug(f"生成摘要成功: {summary.summary}")
+        except LLMError as e:
+            logger.error(f"生成摘要失败: {log_url} - {e}")
+            return None
+        except Exception as e:
+            logger.error(f"处理论文时发生未知错误: {log_url} - {e}")
+            return None
+
+        return self._merge(url, paper_info, summary)
+
+    def _fetch_paper(self, url: Union[str, ProcessedURL]) -> Optional[PaperInfo]:
+        """获取并校验论文信息.
+
+        Args:
+            url: 论文页面 URL 或已处理 URL.
+
+        Returns:
+            论文信息，获取失败、摘要为空或疑似反爬页面时返回 None.
+        """
+        log_url = url.url if isinstance(url, ProcessedURL) else url
         logger.info(f"处理论文: {log_url}")
 
         try:
-            # 1. 获取论文信息
             if isinstance(url, ProcessedURL) and hasattr(
                 self.fetcher, "fetch_processed"
             ):
@@ -77,42 +137,208 @@ class PaperSummarizer:
                 paper_info.abstract
             ):
                 raise PaperFetchError(f"论文信息疑似反爬或验证码页面: {log_url}")
-
-            # 2. 生成摘要
-            summary = self.llm_provider.summarize(paper_info.title, paper_info.abstract)
-            logger.debug(f"生成摘要成功: {summary.summary}")
-
-            # 3. 合并结果
-            return {
-                **paper_info.to_dict(),
-                **summary.to_dict(),
-            }
+            return paper_info
 
         except PaperFetchError as e:
             logger.error(f"获取论文信息失败: {log_url} - {e}")
             return None
-        except LLMError as e:
-            logger.error(f"生成摘要失败: {log_url} - {e}")
-            return None
         except Exception as e:
             logger.error(f"处理论文时发生未知错误: {log_url} - {e}")
             return None
 
+    def _merge(
+        self,
+        url: Union[str, ProcessedURL],
+        paper_info: PaperInfo,
+        summary: SummaryResult,
+    ) -> Dict:
+        """合并论文信息和摘要，并按规范化后的 URL 记住结果.
+
+        Args:
+            url: 结果对应的 URL 或已处理 URL.
+            paper_info: 论文信息.
+            summary: 摘要结果.
+
+        Returns:
+            合并后结果的副本.
+        """
+        result = paper_info.to_dict() | summary.to_dict()
+        self._results[_result_key(url)] = result
+        return dict(result)
+
+    def _summarize(self, title: str, abstract: str) -> SummaryResult:
+        """生成摘要，优先复用缓存.
+
+        缓存键基于 Provider 的配置指纹以及归一化后的标题和摘要前缀，同一论文的
+        不同版本或镜像（仅空白、大小写、标点不同）可以命中同一条缓存，切换模型、
+        生成参数或 Prompt 后不会复用旧摘要.
+
+        Args:
+            title: 论文标题.
+            abstract: 论文摘要.
+
+        Returns:
+            SummaryResult 对象.
+
+        Raises:
+            LLMError: LLM 调用失败.
+        """
+        key, cached = self._lookup_summary(title, abstract)
+        if cached is not None:
+            return cached
+
+        summary = self.llm_provider.summarize(title, abstract)
+        if key is not None:
+            self._cache_set(key, summary.to_dict())
+        return summary
+
+    def _summarize_batch(
+        self, papers: List[PaperInfo]
+    ) -> List[Optional[SummaryResult]]:
+        """批量生成摘要，命中缓存的论文不再调用 LLM.
+
+        Args:
+            papers: 论文信息列表.
+
+        Returns:
+            与输入顺序一致的摘要列表，失败的条目为 None.
+        """
+        summaries: List[Optional[SummaryResult]] = [None] * len(papers)
+        keys: List[Optional[str]] = [None] * len(papers)
+        misses: List[int] = []
+        for index, paper_info in enumerate(papers):
+            keys[index], summaries[index] = self._lookup_summary(
+                paper_info.title, paper_info.abstract
+            )
+            if summaries[index] is None:
+                misses.append(index)
+
+        if not misses:
+            return summaries
+
+        generated = self.llm_provider.summarize_batch(
+            [(papers[i].title, papers[i].abstract) for i in misses],
+            concurrency=self.max_workers,
+        )
+        for index, summary in zip(misses, generated):
+            summaries[index] = summary
+            key = keys[index]
+            if summary is not None and key is not None:
+                self._cache_set(key, summary.to_dict())
+        return summaries
+
+    def _lookup_summary(
+        self, title: str, abstract: str
+    ) -> Tuple[Optional[str], Optional[SummaryResult]]:
+        """查询摘要缓存.
+
+        读取失败或缓存内容无法还原为 SummaryResult（如字段变更、数据损坏）
+        时视为未命中.
+
+        Args:
+            title: 论文标题.
+            abstract: 论文摘要.
+
+        Returns:
+            (缓存键, 缓存的摘要)，未启用缓存时键为 None，未命中时摘要为 None.
+        """
+        if self.summary_cache is None:
+            return None, None
+
+        key = self._summary_cache_key(title, abstract)
+        try:
+            cached = self.summary_cache.get(key)
+            if cached is None:
+                return key, None
+            summary = SummaryResult(**cached)
+        except Exception as e:
+            logger.warning(f"读取摘要缓存失败: {title} - {e}")
+            return key, None
+
+        logger.debug(f"命中摘要缓存: {title}")
+        return key, summary
+
+    def _cache_set(self, key: str, value: Dict) -> None:
+        """写入摘要缓存，写入失败只记录日志.
+
+        Args:
+            key: 缓存键.
+            value: 摘要字典.
+        """
+        try:
+            self.summary_cache.set(key, value)  # type: ignore
+        except Exception as e:
+            logger.warning(f"写入摘要缓存失败: {e}")
+
+    def _summary_cache_key(self, title: str, abstract: str) -> str:
+        """生成摘要缓存键.
+
+        Args:
+            title: 论文标题.
+            abstract: 论文摘要.
+
+        Returns:
+            缓存键.
+        """
+        text = f"{title} {abstract[:_ABSTRACT_KEY_CHARS]}"
+        normalized = _NON_WORD_RE.sub(" ", text).strip().lower()
+        fingerprint = self.llm_provider.cache_fingerprint()
+        return DiskCache.make_key("summary", fingerprint, normalized)
+
     def process_urls(self, urls: List[Union[str, ProcessedURL]]) -> List[Dict]:
         """批量处理多个 URL.
 
+        分两个阶段：先用线程池并发抓取论文信息，再通过 Provider 的
+        summarize_batch 一次性生成全部摘要. 结果顺序与输入顺序保持一致，
+        规范化后相同的 URL 只处理一次.
+
         Args:
             urls: URL 列表.
 
         Returns:
             成功处理的论文列表.
         """
-        results = []
+        if not urls:
+            logger.info("成功处理 0/0 篇论文")
+            return []
 
+        # 按规范化后的 URL 去重，保留首次出现的条目
+        unique: Dict[str, Union[str, ProcessedURL]] = {}
         for url in urls:
-            result = self.process_url(url)
-            if result:
-                results.append(result)
+            unique.setdefault(_result_key(url), url)
+        if len(unique) < len(urls):
+            logger.info(f"去除 {len(urls) - len(unique)} 个重复 URL")
+        urls = list(unique.values())
+
+        pending = [url for key, url in unique.items() if key not in self._results]
+
+        # 1. 并发抓取论文信息
+        workers = min(self.max_workers, max(1, len(pending)))
+        if workers == 1:
+            fetched = [self._fetch_paper(url) for url in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(self._fetch_paper, pending))
+
+        # 2. 一次批量调用生成摘要
+        papers = [
+            (url, paper_info)
+            for url, paper_info in zip(pending, fetched)
+            if paper_info is not None
+        ]
+        summaries = self._summarize_batch([paper_info for _, paper_info in papers])
+        for (url, paper_info), summary in zip(papers, summaries):
+            if summary is None:
+                log_url = url.url if isinstance(url, ProcessedURL) else url
+                logger.error(f"生成摘要失败: {log_url}")
+                continue
+            self._merge(url, paper_info, summary)
+
+        results = []
+        for key in unique:
+            result = self._results.get(key)
+            if result is not None:
+                results.append(dict(result))
 
         logger.info(f"成功处理 {len(results)}/{len(urls)} 篇论文")
         return results
@@ -0,0 +1,53 @@
+"""测试共用的 pytest fixtures."""
+
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.fetchers.composite_fetcher import CompositeFetcher
+from src.llm_providers import LLMProvider
+
+
+@pytest.fixture
+def mock_fetcher():
+    """按 CompositeFetcher 签名校验参数的 Fetcher Mock."""
+    return create_autospec(CompositeFetcher, instance=True)
+
+
+@pytest.fixture
+def mock_provider():
+    """按 LLMProvider 签名校验参数的 LLM Provider Mock，默认可用."""
+    provider = create_autospec(LLMProvider, instance=True)
+    provider.is_available.return_value = True
+    return provider
+
+
+@pytest.fixture(scope="session")
+def sample_papers():
+    """示例论文数据，整个测试会话只构建一次，测试中不要修改."""
+    return [
+        {
+            "title": "Test Paper 1",
+            "authors": ["Author A", "Author B"],
+            "url": "https://arxiv.org/abs/2401.00001",
+            "year": "2024",
+            "venue": "ICML",
+            "summary": "一句话总结1",
+            "background": "研究背景1",
+            "method": "核心方法1",
+            "results": "主要结果1",
+            "relevance_score": 8.5,
+        },
+        {
+            "title": "Test Paper 2",
+            "authors": ["Author C"],
+            "url": "https://arxiv.org/abs/2401.00002",
+            "year": "2023",
+            "venue": "",
+            "summary": "一句话总结2",
+            "background": "",
+            "method": "核心方法2",
+            "results": "",
+            "relevance_score": 7.0,
+        },
+    ]
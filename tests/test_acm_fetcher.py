@@ -56,6 +56,8 @@ class TestACMFetcher:
         assert result.abstract == "This is an ACM abstract."
         assert result.year == "2024"
         assert result.venue == "TestConf 2024"
+        _, kwargs = mock_session.get.call_args
+        assert kwargs["headers"] is fetcher._headers
 
     def test_parse_acm_body_fallback(self, fetcher):
         """测试 ACM 正文 selector 兜底解析."""
@@ -0,0 +1,77 @@
+"""DiskCache 测试."""
+
+import sqlite3
+from unittest.mock import patch
+
+from src.fetchers.cache import DiskCache
+
+
+class TestDiskCache:
+    """测试 DiskCache."""
+
+    def test_set_and_get(self, tmp_path):
+        """测试写入后可读取."""
+        cache = DiskCache(str(tmp_path / "cache" / "papers.sqlite3"))
+        key = DiskCache.make_key("paper", "https://arxiv.org/abs/2401.12345")
+
+        cache.set(key, {"title": "论文", "authors": ["A"]})
+
+        assert cache.get(key) == {"title": "论文", "authors": ["A"]}
+        cache.close()
+
+    def test_get_missing_key(self, tmp_path):
+        """测试不存在的键返回 None."""
+        cache = DiskCache(str(tmp_path / "papers.sqlite3"))
+
+        assert cache.get("missing") is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """测试缓存跨实例持久化."""
+        path = str(tmp_path / "papers.sqlite3")
+        first = DiskCache(path)
+        first.set("key", {"value": 1})
+        first.close()
+
+        second = DiskCache(path)
+        assert second.get("key") == {"value": 1}
+        second.close()
+
+    def test_make_key_is_stable(self):
+        """测试缓存键稳定且区分不同输入."""
+        assert DiskCache.make_key("a", "b") == DiskCache.make_key("a", "b")
+        assert DiskCache.make_key("a", "b") != DiskCache.make_key("ab")
+
+    def test_expired_entry_is_ignored(self, tmp_path):
+        """测试超过有效期的条目视为不存在，重新打开时被清理."""
+        path = str(tmp_path / "papers.sqlite3")
+        cache = DiskCache(path, ttl_sec=60)
+        with patch("src.fetchers.cache.time.time", return_value=1000.0):
+            cache.set("key", {"value": 1})
+
+        with patch("src.fetchers.cache.time.time", return_value=1059.0):
+            assert cache.get("key") == {"value": 1}
+        with patch("src.fetchers.cache.time.time", return_value=1061.0):
+            assert cache.get("key") is None
+            cache.close()
+            DiskCache(path, ttl_sec=60).close()
+
+        # 不设有效期时也读不到，说明条目已被删除
+        reopened = DiskCache(path, ttl_sec=None)
+        assert reopened.get("key") is None
+        reopened.close()
+
+    def test_migrates_cache_without_created_at(self, tmp_path):
+        """测试旧版缓存表自动补充写入时间列，旧条目按过期处理."""
+        path = str(tmp_path / "papers.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO cache VALUES ('old', '{}')")
+        conn.commit()
+        conn.close()
+
+        cache = DiskCache(path)
+        assert cache.get("old") is None
+        cache.set("new", {"value": 1})
+        assert cache.get("new") == {"value": 1}
+        cache.close()
@@ -5,12 +5,22 @@ from unittest.mock import Mock
 import pytest
 
 from src.fetchers import CompositeFetcher, PaperFetchError, PaperInfo
+from src.fetchers.cache import DiskCache
+from src.fetchers.metadata_fetcher import MetadataFetcher
+from src.fetchers.session import POOL_MAXSIZE, create_session
 from src.fetchers.url_processors import ProcessedURL
 
 
 class TestCompositeFetcher:
     """测试 CompositeFetcher."""
 
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """创建临时磁盘缓存，测试结束后关闭."""
+        cache = DiskCache(str(tmp_path / "papers.sqlite3"))
+        yield cache
+        cache.close()
+
     def test_fetch_routes_to_matching_fetcher(self):
         """测试路由到第一个匹配的 Fetcher."""
         first_fetcher = Mock()
@@ -111,3 +121,81 @@ class TestCompositeFetcher:
             "https://ieeexplore.ieee.org/abstract/document/1234567/",
             title_hint="Fallback Paper",
         )
+
+    def test_default_fetchers_share_session(self):
+        """测试默认页面 Fetcher 共用同一个连接池会话."""
+        fetchers = CompositeFetcher.default_fetchers()
+
+        sessions = {id(fetcher.session) for fetcher in fetchers}
+        assert len(sessions) == 1
+        adapter = fetchers[0].session.get_adapter("https://arxiv.org")
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+
+    def test_shared_session_headers_not_mutated(self):
+        """测试共用会话时各 Fetcher 不修改会话请求头."""
+        session = create_session()
+        default_headers = dict(session.headers)
+
+        fetchers = CompositeFetcher.default_fetchers(session=session)
+        MetadataFetcher(session=session)
+
+        assert dict(session.headers) == default_headers
+        assert fetchers[0]._headers["Accept"] == "text/html"
+        assert "Accept" not in fetchers[1]._headers
+
+    def test_fetch_processed_uses_cache(self, cache):
+        """测试命中缓存时不再调用具体 Fetcher."""
+        child_fetcher = Mock()
+        child_fetcher.can_fetch.return_value = True
+        child_fetcher.fetch.return_value = PaperInfo(
+            title="Cached Paper",
+            authors=["Author"],
+            abstract="Abstract",
+            url="https://arxiv.org/abs/2401.12345",
+        )
+        fetcher = CompositeFetcher(fetchers=[child_fetcher], cache=cache)
+        processed = ProcessedURL(url="https://arxiv.org/abs/2401.12345")
+
+        first = fetcher.fetch_processed(processed)
+        second = fetcher.fetch_processed(processed)
+
+        assert first.to_dict() == second.to_dict()
+        child_fetcher.fetch.assert_called_once()
+
+    def test_fetch_processed_does_not_cache_empty_abstract(self, cache):
+        """测试空摘要结果不写入缓存."""
+        child_fetcher = Mock()
+        child_fetcher.can_fetch.return_value = True
+        child_fetcher.fetch.return_value = PaperInfo(
+            title="Paper",
+            authors=[],
+            abstract="",
+            url="https://arxiv.org/abs/2401.12345",
+        )
+        fetcher = CompositeFetcher(fetchers=[child_fetcher], cache=cache)
+        processed = ProcessedURL(url="https://arxiv.org/abs/2401.12345")
+
+        fetcher.fetch_processed(processed)
+        fetcher.fetch_processed(processed)
+
+        assert child_fetcher.fetch.call_count == 2
+
+    def test_fetch_processed_refetches_stale_cache_entry(self, cache):
+        """测试缓存内容无法还原为 PaperInfo 时重新获取并覆盖."""
+        paper = PaperInfo(
+            title="Paper",
+            authors=[],
+            abstract="Abstract",
+            url="https://arxiv.org/abs/2401.12345",
+        )
+        child_fetcher = Mock()
+        child_fetcher.can_fetch.return_value = True
+        child_fetcher.fetch.return_value = paper
+        key = DiskCache.make_key("paper", paper.url)
+        cache.set(key, {"title": "Paper", "obsolete_field": "x"})
+        fetcher = CompositeFetcher(fetchers=[child_fetcher], cache=cache)
+
+        result = fetcher.fetch_processed(ProcessedURL(url=paper.url))
+
+        assert result == paper
+        assert cache.get(key) == paper.to_dict()
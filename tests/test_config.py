@@ -46,6 +46,7 @@ class TestFetcherConfig:
         assert config.timeout_sec == 30.0
         assert config.retry_times == 3
         assert "Mozilla/5.0" in config.user_agent
+        assert config.max_workers == 8
 
 
 class TestLLMConfig:
@@ -139,6 +140,7 @@ class TestConfigFromEnv:
         monkeypatch.setenv("GMAIL_MAX_EMAILS", "25")
         monkeypatch.setenv("FETCHER_TYPE", "docling")
         monkeypatch.setenv("FETCHER_TIMEOUT", "45.0")
+        monkeypatch.setenv("FETCHER_MAX_WORKERS", "4")
         monkeypatch.setenv("LLM_PROVIDER", "gemini")
         monkeypatch.setenv("LLM_TEMPERATURE", "0.7")
 
@@ -148,6 +150,7 @@ class TestConfigFromEnv:
         assert config.gmail.max_emails == 25
         assert config.fetcher.type == "docling"
         assert config.fetcher.timeout_sec == 45.0
+        assert config.fetcher.max_workers == 4
         assert config.llm.provider == "gemini"
         assert config.llm.temperature == 0.7
 
@@ -160,6 +163,7 @@ class TestConfigFromEnv:
             "GMAIL_MAX_EMAILS",
             "FETCHER_TYPE",
             "FETCHER_TIMEOUT",
+            "FETCHER_MAX_WORKERS",
             "LLM_PROVIDER",
             "LLM_TEMPERATURE",
         ]:
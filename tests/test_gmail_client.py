@@ -5,7 +5,32 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.gmail_client import GmailClient, GmailClientError
+from src.gmail_client import (
+    LIST_FIELDS,
+    MESSAGE_FIELDS,
+    GmailClient,
+    GmailClientError,
+)
+
+
+class FakeBatch:
+    """模拟 BatchHttpRequest，按添加顺序依次执行请求."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except Exception as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
 
 
 class TestGmailClient:
@@ -48,6 +73,7 @@ class TestGetUnreadEmails:
             client = GmailClient.__new__(GmailClient)
             client.user_id = "me"
             client.service = Mock()
+            client.service.new_batch_http_request.side_effect = FakeBatch
             return client
 
     def test_get_unread_scholar_emails_success(self, mock_client):
@@ -88,8 +114,31 @@ class TestGetUnreadEmails:
         emails = mock_client.get_unread_scholar_emails("Scholar Alerts")
 
         assert len(emails) == 2
-        assert emails[0]["id"] == "msg1"
-        assert emails[0]["subject"] == "Test Subject 1"
+        assert emails[0].id == "msg1"
+        assert emails[0].subject == "Test Subject 1"
+        mock_client.service.new_batch_http_request.assert_called_once()
+
+    def test_get_unread_scholar_emails_skips_failed_message(self, mock_client):
+        """测试 batch 中单封邮件失败时跳过该邮件."""
+        from googleapiclient.errors import HttpError
+
+        mock_client.service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}, {"id": "msg2"}]
+        }
+        mock_client.service.users().messages().get().execute.side_effect = [
+            HttpError(Mock(status=404), b"Not Found"),
+            {
+                "id": "msg2",
+                "payload": {
+                    "headers": [{"name": "Subject", "value": "Test Subject 2"}],
+                    "body": {"data": base64.urlsafe_b64encode(b"Test body").decode()},
+                },
+            },
+        ]
+
+        emails = mock_client.get_unread_scholar_emails("Scholar Alerts")
+
+        assert [email.id for email in emails] == ["msg2"]
 
     def test_get_unread_scholar_emails_empty(self, mock_client):
         """测试没有未读邮件."""
@@ -139,6 +188,23 @@ class TestGetUnreadEmails:
         call_args = mock_client.service.users().messages().list.call_args
         assert "after:" in call_args[1]["q"]
 
+    def test_get_unread_scholar_emails_requests_partial_fields(self, mock_client):
+        """测试列表和详情请求只拉取需要的字段."""
+        mock_client.service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}]
+        }
+        mock_client.service.users().messages().get().execute.return_value = {
+            "id": "msg1",
+            "payload": {"headers": [], "body": {}},
+        }
+
+        mock_client.get_unread_scholar_emails()
+
+        list_kwargs = mock_client.service.users().messages().list.call_args[1]
+        get_kwargs = mock_client.service.users().messages().get.call_args[1]
+        assert list_kwargs["fields"] == LIST_FIELDS
+        assert get_kwargs["fields"] == MESSAGE_FIELDS
+
     def test_get_unread_scholar_emails_default_days_back(self, mock_client):
         """测试默认使用 scholar 标签."""
         mock_client.service.users().messages().list().execute.return_value = {
@@ -206,6 +272,38 @@ class TestExtractLinks:
         assert links == []
 
 
+class TestExtractBody:
+    """测试邮件正文提取."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """创建模拟的 GmailClient."""
+        return GmailClient.__new__(GmailClient)
+
+    def test_html_part_drops_script_and_style(self, mock_client):
+        """测试 HTML 正文去除标签、脚本和样式内容."""
+        html = (
+            "<html><head><style>.a { color: red; }</style></head><body>"
+            "<p>Paper: https://arxiv.org/abs/2401.12345</p>"
+            "<script>var tracking = 1;</script></body></html>"
+        )
+        payload = {
+            "parts": [
+                {
+                    "mimeType": "text/html",
+                    "body": {"data": base64.urlsafe_b64encode(html.encode()).decode()},
+                }
+            ]
+        }
+
+        body = mock_client._extract_body(payload)
+
+        assert "https://arxiv.org/abs/2401.12345" in body
+        assert "tracking" not in body
+        assert "color" not in body
+        assert "<p>" not in body
+
+
 class TestSendEmail:
     """测试发送邮件功能."""
 
@@ -293,10 +391,30 @@ class TestMarkAsRead:
             mock_client.mark_as_read("msg_123")
 
     def test_batch_mark_as_read(self, mock_client):
-        """测试批量标记已读."""
-        mock_client.service.users().messages().modify().execute.return_value = {}
+        """测试批量标记已读使用单次 batchModify."""
+        mock_client.service.users().messages().batchModify().execute.return_value = {}
         mock_client.service.reset_mock()
 
         mock_client.batch_mark_as_read(["msg1", "msg2", "msg3"])
 
-        assert mock_client.service.users().messages().modify.call_count == 3
+        batch_modify = mock_client.service.users().messages().batchModify
+        assert batch_modify.call_count == 1
+        assert batch_modify.call_args[1]["body"] == {
+            "ids": ["msg1", "msg2", "msg3"],
+            "removeLabelIds": ["UNREAD"],
+        }
+        mock_client.service.users().messages().modify.assert_not_called()
+
+    def test_batch_mark_as_read_chunks_large_lists(self, mock_client):
+        """测试超过 1000 个 ID 时分批调用 batchModify."""
+        message_ids = [f"msg{i}" for i in range(2500)]
+
+        mock_client.batch_mark_as_read(message_ids)
+
+        batch_modify = mock_client.service.users().messages().batchModify
+        chunk_sizes = [
+            len(call[1]["body"]["ids"])
+            for call in batch_modify.call_args_list
+            if call[1]
+        ]
+        assert chunk_sizes == [1000, 1000, 500]
@@ -127,6 +127,28 @@ class TestNonPaperLinkFilter:
         url = "https://example.com/paper.pdf"
         assert not filter.should_keep(url)
 
+    def test_repeated_url_hits_cache(self, filter):
+        """测试重复 URL 直接复用缓存的判定结果."""
+        url = "https://arxiv.org/abs/2301.00001"
+
+        assert filter.should_keep(url)
+        assert filter.should_keep(url)
+
+        info = filter._is_paper_link.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_subclass_patterns_are_used(self):
+        """测试子类覆盖的模式列表生效."""
+
+        class DoiLinkFilter(NonPaperLinkFilter):
+            PAPER_INDICATORS = NonPaperLinkFilter.PAPER_INDICATORS + [r"doi\.org/"]
+
+        url = "https://doi.org/10.1145/1234567"
+
+        assert DoiLinkFilter().should_keep(url)
+        assert not NonPaperLinkFilter().should_keep(url)
+
 
 class TestLinkExtractor:
     """测试链接提取器."""
@@ -194,6 +216,27 @@ class TestLinkExtractor:
         assert len(links) == 1
         assert not links[0].endswith(".")
 
+    def test_extract_clean_multiple_trailing_punctuation(self):
+        """测试清理连续的末尾标点，保留 URL 内部的标点."""
+        text = "(see https://arxiv.org/abs/2401.12345)."
+        links = LinkExtractor().extract_links(text)
+
+        assert links == ["https://arxiv.org/abs/2401.12345"]
+
+    def test_extract_keeps_first_occurrence_order(self):
+        """测试去重后按首次出现顺序返回."""
+        text = (
+            "https://arxiv.org/abs/2401.00002 "
+            "https://arxiv.org/abs/2401.00001 "
+            "https://arxiv.org/abs/2401.00002"
+        )
+        links = LinkExtractor().extract_links(text)
+
+        assert links == [
+            "https://arxiv.org/abs/2401.00002",
+            "https://arxiv.org/abs/2401.00001",
+        ]
+
     def test_extract_no_links(self):
         """测试没有链接的情况."""
         text = "This is just plain text without any URLs."
@@ -0,0 +1,37 @@
+"""main 配置合并测试."""
+
+from main import _merge_configs
+from src.config import Config
+
+
+def test_merge_configs_overrides_only_non_default_fields():
+    """测试只有显式修改的字段会覆盖基础配置."""
+    base = Config()
+    base.gmail.label = "yaml-label"
+    base.fetcher.retry_times = 5
+    base.llm.max_tokens = 2000
+
+    override = Config()
+    override.fetcher.timeout_sec = 45.0
+    override.llm.provider = "gemini"
+    override.report.format = "html"
+
+    merged = _merge_configs(base, override)
+
+    assert merged.gmail.label == "yaml-label"
+    assert merged.fetcher.retry_times == 5
+    assert merged.fetcher.timeout_sec == 45.0
+    assert merged.llm.provider == "gemini"
+    assert merged.llm.max_tokens == 2000
+    assert merged.report.format == "html"
+
+
+def test_merge_configs_boolean_override():
+    """测试布尔字段改为非默认值时覆盖."""
+    base = Config()
+    override = Config()
+    override.gmail.unread_only = False
+
+    merged = _merge_configs(base, override)
+
+    assert merged.gmail.unread_only is False
@@ -1,13 +1,15 @@
 """main 链接处理测试."""
 
 from main import get_unique_links
+from src.gmail_client import EmailRecord
 
 
 def test_get_unique_links_deduplicates_scholar_share_variants():
     """测试 Scholar share 不同分享渠道去重为同一论文 URL."""
     emails = [
-        {
-            "links": [
+        EmailRecord(
+            id="msg1",
+            links=[
                 (
                     "https://scholar.google.com/scholar_share?"
                     "ss=fb&url=https://ieeexplore.ieee.org/abstract/document/11527248/&"
@@ -18,8 +20,8 @@ def test_get_unique_links_deduplicates_scholar_share_variants():
                     "ss=tw&url=https://ieeexplore.ieee.org/abstract/document/11527248/&"
                     "rt=Cleaning+up+the+Mess"
                 ),
-            ]
-        }
+            ],
+        )
     ]
 
     links = get_unique_links(emails)
@@ -32,8 +34,9 @@ def test_get_unique_links_deduplicates_scholar_share_variants():
 def test_get_unique_links_deduplicates_html_escaped_scholar_share_variants():
     """测试 HTML 转义 Scholar share 链接也能去重."""
     emails = [
-        {
-            "links": [
+        EmailRecord(
+            id="msg1",
+            links=[
                 (
                     "https://scholar.google.com/scholar_share?"
                     "hl=en&amp;ss=fb&amp;"
@@ -46,8 +49,8 @@ def test_get_unique_links_deduplicates_html_escaped_scholar_share_variants():
                     "url=https://ieeexplore.ieee.org/abstract/document/11527248/&amp;"
                     "rt=Cleaning+up+the+Mess"
                 ),
-            ]
-        }
+            ],
+        )
     ]
 
     links = get_unique_links(emails)
@@ -55,3 +58,25 @@ def test_get_unique_links_deduplicates_html_escaped_scholar_share_variants():
     assert len(links) == 1
     assert links[0].url == "https://ieeexplore.ieee.org/abstract/document/11527248/"
     assert links[0].title_hint == "Cleaning up the Mess"
+
+
+def test_get_unique_links_keeps_first_occurrence_order():
+    """测试去重后保持首次出现顺序."""
+    emails = [
+        EmailRecord(
+            id="msg1",
+            links=[
+                "https://arxiv.org/pdf/2401.00002",
+                "https://arxiv.org/abs/2401.00001",
+            ],
+        ),
+        EmailRecord(id="msg2", links=["https://arxiv.org/abs/2401.00002"]),
+        EmailRecord(id="msg3"),
+    ]
+
+    links = get_unique_links(emails)
+
+    assert [link.url for link in links] == [
+        "https://arxiv.org/abs/2401.00002",
+        "https://arxiv.org/abs/2401.00001",
+    ]
@@ -1,10 +1,50 @@
 """Fetcher 模块测试."""
 
+import dataclasses
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+from bs4 import BeautifulSoup
 
 from src.fetchers import PaperFetchError, PaperInfo, SimpleHTMLFetcher
+from src.fetchers.simple_html_fetcher import MAX_RESPONSE_BYTES
+
+_SCHOLAR_HTML = """
+<html>
+<body>
+    <h3 class="gs_rt">Test Paper Title [PDF]</h3>
+    <div class="gs_a">Author 1, Author 2 - Journal 2024</div>
+    <div class="gs_rs">This is the abstract of the paper.</div>
+</body>
+</html>
+"""
+
+_ARXIV_HTML = """
+<html>
+<body>
+    <h1 class="title mathjax">Title: Test arXiv Paper</h1>
+    <div class="authors">
+        <a href="/author/1">Author One</a>
+        <a href="/author/2">Author Two</a>
+    </div>
+    <blockquote class="abstract mathjax">
+        Abstract: This is a test abstract for arXiv paper.
+    </blockquote>
+    <div class="dateline">Submitted on 15 Jan 2024</div>
+</body>
+</html>
+"""
+
+
+def _make_response(html: str) -> Mock:
+    """构造以 stream 模式读取的模拟响应."""
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+    mock_response.encoding = "utf-8"
+    mock_response.iter_content.return_value = [html.encode("utf-8")]
+    return mock_response
 
 
 class TestPaperInfo:
@@ -44,6 +84,18 @@ class TestPaperInfo:
         assert data["abstract"] == "Test abstract"
         assert data["url"] == "https://example.com/paper"
 
+    def test_immutable(self):
+        """测试论文信息不可修改."""
+        info = PaperInfo(
+            title="Test Title",
+            authors=[],
+            abstract="Test abstract",
+            url="https://example.com/paper",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.title = "Other"  # type: ignore[misc]
+
 
 class TestSimpleHTMLFetcher:
     """测试 SimpleHTMLFetcher."""
@@ -53,115 +105,213 @@ class TestSimpleHTMLFetcher:
         """创建 Fetcher 实例."""
         return SimpleHTMLFetcher(timeout_sec=5.0, retry_times=2)
 
-    def test_can_fetch_scholar(self, fetcher):
-        """测试能否处理 Google Scholar URL."""
-        assert fetcher.can_fetch("https://scholar.google.com/scholar?cluster=123")
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://scholar.google.com/scholar?cluster=123", True),
+            ("https://arxiv.org/abs/2401.12345", True),
+            ("https://arxiv.org/pdf/2401.12345.pdf", True),
+            ("https://example.com/paper", False),
+            ("https://ieee.org/document/123", False),
+            # 按 host 判断：支持子域名，不匹配查询参数中的域名
+            ("https://export.arxiv.org/abs/2401.12345", True),
+            ("https://example.com/?ref=arxiv.org", False),
+        ],
+    )
+    def test_can_fetch(self, fetcher, url, expected):
+        """测试能否处理 Google Scholar / arXiv URL."""
+        assert fetcher.can_fetch(url) is expected
+
+    def test_fetch_redirect_to_unsupported_host(self, fetcher):
+        """测试 Scholar 重定向到不支持的站点时不发起请求."""
+        fetcher.session = Mock()
 
-    def test_can_fetch_arxiv(self, fetcher):
-        """测试能否处理 arXiv URL."""
-        assert fetcher.can_fetch("https://arxiv.org/abs/2401.12345")
-        assert fetcher.can_fetch("https://arxiv.org/pdf/2401.12345.pdf")
+        with pytest.raises(PaperFetchError, match="不支持的 URL"):
+            fetcher.fetch(
+                "https://scholar.google.com/scholar_url?"
+                "url=https://dl.acm.org/doi/10.1145/1234567"
+            )
 
-    def test_cannot_fetch_other(self, fetcher):
-        """测试不能处理其他 URL."""
-        assert not fetcher.can_fetch("https://example.com/paper")
-        assert not fetcher.can_fetch("https://ieee.org/document/123")
+        fetcher.session.get.assert_not_called()
 
     def test_fetch_unsupported_url(self, fetcher):
         """测试获取不支持的 URL."""
         with pytest.raises(PaperFetchError, match="不支持的 URL"):
             fetcher.fetch("https://example.com/paper")
 
-    @patch("src.fetchers.simple_html_fetcher.requests.Session")
-    def test_fetch_scholar_success(self, mock_session_class, fetcher):
-        """测试成功获取 Google Scholar 页面."""
-        # 模拟响应
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = """
-        <html>
-        <body>
-            <h3 class="gs_rt">Test Paper Title [PDF]</h3>
-            <div class="gs_a">Author 1, Author 2 - Journal 2024</div>
-            <div class="gs_rs">This is the abstract of the paper.</div>
-        </body>
-        </html>
+    @pytest.mark.parametrize(
+        "url,html,expected_title,expected_authors,expected_abstract,expected_year",
+        [
+            pytest.param(
+                "https://scholar.google.com/scholar?cluster=123",
+                _SCHOLAR_HTML,
+                "Test Paper Title",
+                ["Author 1", "Author 2"],
+                "This is the abstract of the paper.",
+                "",
+                id="scholar",
+            ),
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345",
+                _ARXIV_HTML,
+                "Test arXiv Paper",
+                ["Author One", "Author Two"],
+                "This is a test abstract for arXiv paper.",
+                "2024",
+                id="arxiv",
+            ),
+        ],
+    )
+    def test_fetch_success(
+        self,
+        fetcher,
+        url,
+        html,
+        expected_title,
+        expected_authors,
+        expected_abstract,
+        expected_year,
+    ):
+        """测试成功获取 Google Scholar / arXiv 页面."""
+        fetcher.session = Mock()
+        fetcher.session.get.return_value = _make_response(html)
+
+        result = fetcher.fetch(url)
+
+        assert result.title == expected_title
+        assert result.authors == expected_authors
+        assert result.abstract == expected_abstract
+        assert result.year == expected_year
+
+    def test_parse_scholar_detail_page_single_pass(self, fetcher):
+        """测试 Scholar 详情页在局部解析中即可取到标题，无需回退完整解析."""
+        html = """
+        <html><body>
+            <div id="gsc_vcd_title">Detail Page Title</div>
+            <div class="gs_rs">Detail abstract.</div>
+        </body></html>
         """
 
-        mock_session = Mock()
-        mock_session.get.return_value = mock_response
-        mock_session_class.return_value = mock_session
+        with patch(
+            "src.fetchers.simple_html_fetcher.BeautifulSoup", wraps=BeautifulSoup
+        ) as mock_soup:
+            result = fetcher._parse_html(
+                html, "https://scholar.google.com/citations?x=1"
+            )
 
-        fetcher.session = mock_session
+        assert mock_soup.call_count == 1
+
+        assert result.title == "Detail Page Title"
+        assert result.abstract == "Detail abstract."
+
+    def test_fetch_detects_meta_charset_without_header(self, fetcher):
+        """测试响应头未声明编码时按页面 meta charset 解码."""
+        html = (
+            '<html><head><meta charset="gbk"></head><body>'
+            '<h3 class="gs_rt">中文论文标题</h3></body></html>'
+        )
+        mock_response = _make_response("")
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.encoding = "ISO-8859-1"
+        mock_response.iter_content.return_value = [html.encode("gbk")]
+        fetcher.session = Mock()
+        fetcher.session.get.return_value = mock_response
 
         result = fetcher.fetch("https://scholar.google.com/scholar?cluster=123")
 
-        assert result.title == "Test Paper Title"
-        assert result.authors == ["Author 1", "Author 2"]
-        assert result.abstract == "This is the abstract of the paper."
+        assert result.title == "中文论文标题"
 
-    @patch("src.fetchers.simple_html_fetcher.requests.Session")
-    def test_fetch_arxiv_success(self, mock_session_class, fetcher):
-        """测试成功获取 arXiv 页面."""
-        # 模拟响应
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = """
-        <html>
-        <body>
-            <h1 class="title mathjax">Title: Test arXiv Paper</h1>
-            <div class="authors">
-                <a href="/author/1">Author One</a>
-                <a href="/author/2">Author Two</a>
-            </div>
-            <blockquote class="abstract mathjax">
-                Abstract: This is a test abstract for arXiv paper.
-            </blockquote>
-            <div class="dateline">Submitted on 15 Jan 2024</div>
-        </body>
-        </html>
-        """
+    def test_fetch_truncates_large_response(self, fetcher):
+        """测试超大响应只读取前 MAX_RESPONSE_BYTES 字节."""
+        consumed = []
 
-        mock_session = Mock()
-        mock_session.get.return_value = mock_response
-        mock_session_class.return_value = mock_session
+        def chunks(_chunk_size):
+            yield b'<h3 class="gs_rt">Large Page</h3>'
+            for _ in range(8):
+                chunk = b" " * (1024 * 1024)
+                consumed.append(chunk)
+                yield chunk
 
-        fetcher.session = mock_session
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {}
+        mock_response.encoding = None
+        mock_response.iter_content.side_effect = chunks
+        fetcher.session = Mock()
+        fetcher.session.get.return_value = mock_response
 
-        result = fetcher.fetch("https://arxiv.org/abs/2401.12345")
+        result = fetcher.fetch("https://scholar.google.com/scholar?cluster=123")
 
-        assert result.title == "Test arXiv Paper"
-        assert result.authors == ["Author One", "Author Two"]
-        assert "test abstract" in result.abstract
-        assert result.year == "2024"
+        assert result.title == "Large Page"
+        assert sum(map(len, consumed)) <= MAX_RESPONSE_BYTES
+        mock_response.close.assert_called_once()
 
-    @patch("src.fetchers.simple_html_fetcher.requests.Session")
-    def test_fetch_timeout_retry(self, mock_session_class, fetcher):
+    @patch("src.fetchers.simple_html_fetcher.time.sleep")
+    def test_fetch_timeout_retry(self, mock_sleep, fetcher):
         """测试超时重试."""
-        import requests
-
         mock_session = Mock()
         mock_session.get.side_effect = requests.Timeout("Request timed out")
-        mock_session_class.return_value = mock_session
 
         fetcher.session = mock_session
 
         with pytest.raises(PaperFetchError, match="已重试"):
             fetcher.fetch("https://scholar.google.com/scholar?cluster=123")
 
-        # 应该重试 retry_times 次
+        # 应该重试 retry_times 次，重试之间退避等待
         assert mock_session.get.call_count == fetcher.retry_times
+        assert mock_sleep.call_count == fetcher.retry_times - 1
+
+    @patch("src.fetchers.simple_html_fetcher.time.sleep")
+    def test_fetch_client_error_fails_fast(self, mock_sleep, fetcher):
+        """测试 404 等客户端错误不重试."""
+        mock_response = _make_response("")
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "404 Not Found", response=Mock(status_code=404)
+        )
+        fetcher.session = Mock()
+        fetcher.session.get.return_value = mock_response
+
+        with pytest.raises(PaperFetchError, match="请求失败"):
+            fetcher.fetch("https://arxiv.org/abs/2401.12345")
+
+        assert fetcher.session.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("src.fetchers.simple_html_fetcher.time.sleep")
+    def test_fetch_server_error_retries(self, mock_sleep, fetcher):
+        """测试 5xx 错误按退避重试."""
+        mock_response = _make_response("")
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "503 Service Unavailable", response=Mock(status_code=503)
+        )
+        fetcher.session = Mock()
+        fetcher.session.get.return_value = mock_response
 
-    @patch("src.fetchers.simple_html_fetcher.requests.Session")
-    def test_fetch_missing_title(self, mock_session_class, fetcher):
+        with pytest.raises(PaperFetchError, match="已重试"):
+            fetcher.fetch("https://arxiv.org/abs/2401.12345")
+
+        assert fetcher.session.get.call_count == fetcher.retry_times
+        assert mock_sleep.call_count == fetcher.retry_times - 1
+        assert 1 <= mock_sleep.call_args_list[0][0][0] <= 1.5
+
+    @patch("src.fetchers.simple_html_fetcher.time.sleep")
+    def test_fetch_connection_error_retries_once(self, mock_sleep):
+        """测试连接失败只重试一次."""
+        fetcher = SimpleHTMLFetcher(retry_times=5)
+        fetcher.session = Mock()
+        fetcher.session.get.side_effect = requests.ConnectionError("refused")
+
+        with pytest.raises(PaperFetchError, match="连接失败"):
+            fetcher.fetch("https://arxiv.org/abs/2401.12345")
+
+        assert fetcher.session.get.call_count == 2
+
+    def test_fetch_missing_title(self, fetcher):
         """测试页面缺少标题."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = "<html><body>No title here</body></html>"
+        mock_response = _make_response("<html><body>No title here</body></html>")
 
         mock_session = Mock()
         mock_session.get.return_value = mock_response
-        mock_session_class.return_value = mock_session
 
         fetcher.session = mock_session
 
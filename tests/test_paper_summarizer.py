@@ -1,14 +1,35 @@
 """PaperSummarizer 测试."""
 
+import sqlite3
+import time
+from functools import partial
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.fetchers import PaperFetchError, PaperInfo
+from src.fetchers.cache import DiskCache
 from src.fetchers.url_processors import ProcessedURL
-from src.llm_providers import LLMError, SummaryResult
+from src.llm_providers import LLMError, LLMProvider, SummaryResult
 from src.summarizer import PaperSummarizer, SummarizerError
 
+# 各测试共用的摘要结果，测试中只读取不修改
+_DEFAULT_SUMMARY = SummaryResult(
+    summary="Summary",
+    background="Background",
+    method="Method",
+    results="Results",
+    relevance_score=8.0,
+)
+
+# 批量处理测试使用的论文信息，按 URL 预先构建（PaperInfo 不可变，可共享）
+_PAPERS = {
+    url: PaperInfo(
+        title=f"Paper {url}", authors=["Author"], abstract="Abstract", url=url
+    )
+    for url in (f"https://arxiv.org/abs/{i}" for i in range(1, 4))
+}
+
 
 class TestPaperSummarizer:
     """测试 PaperSummarizer."""
@@ -54,12 +75,8 @@ class TestProcessUrl:
     """测试处理单个 URL."""
 
     @pytest.fixture
-    def summarizer(self):
+    def summarizer(self, mock_fetcher, mock_provider):
         """创建 Summarizer 实例."""
-        mock_fetcher = Mock()
-        mock_provider = Mock()
-        mock_provider.is_available.return_value = True
-
         return PaperSummarizer(
             fetcher=mock_fetcher,
             llm_provider=mock_provider,
@@ -174,13 +191,7 @@ class TestProcessUrl:
             abstract="Test abstract",
             url="https://example.com/paper",
         )
-        mock_provider.summarize.return_value = SummaryResult(
-            summary="Summary",
-            background="Background",
-            method="Method",
-            results="Results",
-            relevance_score=None,
-        )
+        mock_provider.summarize.return_value = _DEFAULT_SUMMARY
         summarizer = PaperSummarizer(
             fetcher=mock_fetcher,
             llm_provider=mock_provider,
@@ -198,82 +209,307 @@ class TestProcessUrls:
     """测试批量处理 URL."""
 
     @pytest.fixture
-    def summarizer(self):
+    def summarizer(self, mock_fetcher, mock_provider):
         """创建 Summarizer 实例."""
-        mock_fetcher = Mock()
-        mock_provider = Mock()
-        mock_provider.is_available.return_value = True
+        # 批量接口走基类默认实现，逐条调用 summarize
+        mock_provider.summarize_batch.side_effect = partial(
+            LLMProvider.summarize_batch, mock_provider
+        )
 
         return PaperSummarizer(
             fetcher=mock_fetcher,
             llm_provider=mock_provider,
         )
 
-    def test_process_urls_all_success(self, summarizer):
-        """测试所有 URL 都成功处理."""
+    @pytest.mark.parametrize(
+        "urls,failing_urls,expected_len",
+        [
+            pytest.param(
+                [
+                    "https://arxiv.org/abs/1",
+                    "https://arxiv.org/abs/2",
+                    "https://arxiv.org/abs/3",
+                ],
+                set(),
+                3,
+                id="all_success",
+            ),
+            pytest.param(
+                [
+                    "https://arxiv.org/abs/1",
+                    "https://arxiv.org/abs/2",
+                    "https://arxiv.org/abs/3",
+                ],
+                {"https://arxiv.org/abs/2"},
+                2,
+                id="partial_success",
+            ),
+            pytest.param([], set(), 0, id="empty_list"),
+        ],
+    )
+    def test_process_urls_success_count(
+        self, summarizer, urls, failing_urls, expected_len
+    ):
+        """测试批量处理只返回成功的论文，抓取失败的 URL 被跳过."""
 
-        # 模拟成功返回
         def mock_fetch(url):
-            return PaperInfo(
-                title=f"Paper {url}",
-                authors=["Author"],
-                abstract="Abstract",
-                url=url,
-            )
+            if url in failing_urls:
+                raise PaperFetchError("Failed")
+            return _PAPERS[url]
 
         summarizer.fetcher.fetch.side_effect = mock_fetch
-        summarizer.llm_provider.summarize.return_value = SummaryResult(
-            summary="Summary",
-            background="Background",
-            method="Method",
-            results="Results",
-            relevance_score=8.0,
-        )
+        summarizer.llm_provider.summarize.return_value = _DEFAULT_SUMMARY
 
-        urls = [
-            "https://arxiv.org/abs/1",
-            "https://arxiv.org/abs/2",
-            "https://arxiv.org/abs/3",
-        ]
         results = summarizer.process_urls(urls)
 
-        assert len(results) == 3
+        assert len(results) == expected_len
+        assert summarizer.fetcher.fetch.call_count == len(urls)
 
-    def test_process_urls_partial_success(self, summarizer):
-        """测试部分 URL 成功处理."""
+    def test_process_urls_concurrent_preserves_order(self, summarizer):
+        """测试并发处理时结果顺序与输入一致."""
 
-        # 第一个成功，第二个失败，第三个成功
         def mock_fetch(url):
-            if "2" in url:
-                raise PaperFetchError("Failed")
-            return PaperInfo(
-                title=f"Paper {url}",
-                authors=["Author"],
-                abstract="Abstract",
-                url=url,
-            )
+            # 越靠前的 URL 越晚返回
+            time.sleep(0.01 * (4 - int(url[-1])))
+            return _PAPERS[url]
 
         summarizer.fetcher.fetch.side_effect = mock_fetch
-        summarizer.llm_provider.summarize.return_value = SummaryResult(
-            summary="Summary",
-            background="Background",
-            method="Method",
-            results="Results",
-            relevance_score=8.0,
+        summarizer.llm_provider.summarize.return_value = _DEFAULT_SUMMARY
+
+        urls = [f"https://arxiv.org/abs/{i}" for i in range(1, 4)]
+        results = summarizer.process_urls(urls)
+
+        assert [r["url"] for r in results] == urls
+
+    def test_process_urls_summarizes_in_one_batch(self, summarizer):
+        """测试抓取完成后只调用一次批量摘要，失败的条目被跳过."""
+        summarizer.fetcher.fetch.side_effect = _PAPERS.__getitem__
+        summarizer.llm_provider.summarize_batch.side_effect = None
+        summarizer.llm_provider.summarize_batch.return_value = [
+            SummaryResult(summary="S1", background="", method="", results=""),
+            None,
+        ]
+
+        results = summarizer.process_urls(
+            ["https://arxiv.org/abs/1", "https://arxiv.org/abs/2"]
         )
 
-        urls = [
-            "https://arxiv.org/abs/1",
-            "https://arxiv.org/abs/2",  # 会失败
-            "https://arxiv.org/abs/3",
+        summarizer.llm_provider.summarize_batch.assert_called_once()
+        items = summarizer.llm_provider.summarize_batch.call_args.args[0]
+        assert items == [
+            ("Paper https://arxiv.org/abs/1", "Abstract"),
+            ("Paper https://arxiv.org/abs/2", "Abstract"),
         ]
+        assert [r["summary"] for r in results] == ["S1"]
+
+    def test_process_urls_isolates_unexpected_error(self, summarizer):
+        """测试单篇摘要抛出非 LLMError 异常时只跳过该篇."""
+
+        def mock_summarize(title, abstract):
+            if title.endswith("/2"):
+                raise KeyError("choices")
+            return _DEFAULT_SUMMARY
+
+        summarizer.fetcher.fetch.side_effect = _PAPERS.__getitem__
+        summarizer.llm_provider.summarize.side_effect = mock_summarize
+
+        urls = [f"https://arxiv.org/abs/{i}" for i in range(1, 4)]
         results = summarizer.process_urls(urls)
 
-        assert len(results) == 2
+        assert [r["url"] for r in results] == [urls[0], urls[2]]
+
+
+class TestProcessUrlsDedup:
+    """测试 process_urls 去重."""
+
+    def test_duplicate_urls_processed_once(self):
+        """测试规范化后相同的 URL 只处理一次，顺序按首次出现."""
+        summarizer = PaperSummarizer(fetcher=Mock(), llm_provider=Mock(), max_workers=1)
+        summarizer.fetcher.fetch.side_effect = lambda url: PaperInfo(
+            title="Paper", authors=[], abstract="Abstract", url=url
+        )
+        summarizer.llm_provider.summarize_batch.side_effect = lambda items, **_: [
+            SummaryResult(summary="S", background="", method="", results="")
+            for _ in items
+        ]
+
+        results = summarizer.process_urls(
+            [
+                "https://arxiv.org/pdf/2401.00001",
+                "https://arxiv.org/abs/2401.00002",
+                "https://arxiv.org/abs/2401.00001",
+            ]
+        )
+
+        assert [r["url"] for r in results] == [
+            "https://arxiv.org/pdf/2401.00001",
+            "https://arxiv.org/abs/2401.00002",
+        ]
+        assert summarizer.fetcher.fetch.call_count == 2
+
+
+class TestProcessUrlMemo:
+    """测试 process_url 的运行内结果记忆."""
+
+    def _make_summarizer(self):
+        fetcher = Mock()
+        fetcher.fetch.return_value = PaperInfo(
+            title="Test Paper",
+            authors=[],
+            abstract="Abstract",
+            url="https://arxiv.org/abs/2401.00001",
+        )
+        provider = Mock()
+        provider.is_available.return_value = True
+        provider.summarize.return_value = _DEFAULT_SUMMARY
+        return PaperSummarizer(fetcher=fetcher, llm_provider=provider)
+
+    def test_repeated_url_reuses_result(self):
+        """测试重复 URL 不再抓取和调用 LLM."""
+        summarizer = self._make_summarizer()
+
+        first = summarizer.process_url("https://arxiv.org/abs/2401.00001")
+        second = summarizer.process_url("https://arxiv.org/abs/2401.00001")
+
+        summarizer.fetcher.fetch.assert_called_once()
+        summarizer.llm_provider.summarize.assert_called_once()
+        assert first == second
+        assert first is not second
+
+    def test_failed_url_is_retried(self):
+        """测试失败的 URL 不被记忆."""
+        summarizer = self._make_summarizer()
+        summarizer.llm_provider.summarize.side_effect = [
+            LLMError("boom"),
+            SummaryResult(summary="Summary", background="", method="", results=""),
+        ]
+
+        assert summarizer.process_url("https://arxiv.org/abs/2401.00001") is None
+        assert summarizer.process_url("https://arxiv.org/abs/2401.00001") is not None
+
+    def test_process_urls_memo_uses_normalized_key(self):
+        """测试规范化前后写法不同的 URL 在多次批量处理间只抓取一次."""
+        summarizer = self._make_summarizer()
+        summarizer.llm_provider.summarize_batch.side_effect = lambda items, **_: [
+            _DEFAULT_SUMMARY for _ in items
+        ]
+        url = "https://arxiv.org/pdf/2401.00001.pdf"
+
+        first = summarizer.process_urls([url])
+        second = summarizer.process_urls([url])
+
+        summarizer.fetcher.fetch.assert_called_once()
+        assert len(first) == len(second) == 1
+        assert first == second
+
+
+class TestSummaryCache:
+    """测试摘要缓存."""
+
+    def test_reuses_summary_for_same_paper_variants(self, tmp_path):
+        """测试仅格式不同的同一论文复用缓存摘要."""
+        fetcher = Mock()
+        fetcher.fetch.side_effect = [
+            PaperInfo(
+                title="Test Paper",
+                authors=[],
+                abstract="An  abstract, v1.",
+                url="https://arxiv.org/abs/2401.00001",
+            ),
+            PaperInfo(
+                title="test paper",
+                authors=[],
+                abstract="An abstract v1",
+                url="https://arxiv.org/abs/2401.00002",
+            ),
+        ]
+        provider = Mock()
+        provider.is_available.return_value = True
+        provider.cache_fingerprint.return_value = "model"
+        provider.summarize.return_value = _DEFAULT_SUMMARY
+        summarizer = PaperSummarizer(
+            fetcher=fetcher,
+            llm_provider=provider,
+            summary_cache=DiskCache(str(tmp_path / "papers.sqlite3")),
+        )
+
+        first = summarizer.process_url("https://arxiv.org/abs/2401.00001")
+        second = summarizer.process_url("https://arxiv.org/abs/2401.00002")
+
+        provider.summarize.assert_called_once()
+        assert second["summary"] == first["summary"] == "Summary"
+        assert second["url"] == "https://arxiv.org/abs/2401.00002"
+
+    def test_summary_cache_is_scoped_by_provider_fingerprint(self, tmp_path):
+        """测试 Provider 配置指纹不同时不复用缓存摘要."""
+        cache = DiskCache(str(tmp_path / "papers.sqlite3"))
+        paper = PaperInfo(
+            title="Test Paper",
+            authors=[],
+            abstract="Abstract",
+            url="https://arxiv.org/abs/2401.00001",
+        )
+        summary = _DEFAULT_SUMMARY
+
+        providers = []
+        for fingerprint in ("model-a", "model-b"):
+            fetcher = Mock()
+            fetcher.fetch.return_value = paper
+            provider = Mock()
+            provider.cache_fingerprint.return_value = fingerprint
+            provider.is_available.return_value = True
+            provider.summarize.return_value = summary
+            providers.append(provider)
+            PaperSummarizer(
+                fetcher=fetcher, llm_provider=provider, summary_cache=cache
+            ).process_url(paper.url)
+
+        for provider in providers:
+            provider.summarize.assert_called_once()
+
+    def test_batch_treats_cache_errors_as_miss(self):
+        """测试缓存读写异常时按未命中处理，不影响整批结果."""
+        fetcher = Mock()
+        fetcher.fetch.side_effect = _PAPERS.__getitem__
+        provider = Mock()
+        provider.is_available.return_value = True
+        provider.cache_fingerprint.return_value = "model"
+        provider.summarize_batch.side_effect = lambda items, **_: [
+            _DEFAULT_SUMMARY for _ in items
+        ]
+        cache = Mock()
+        cache.get.side_effect = sqlite3.OperationalError("database is locked")
+        cache.set.side_effect = sqlite3.OperationalError("disk is full")
+        summarizer = PaperSummarizer(
+            fetcher=fetcher, llm_provider=provider, summary_cache=cache
+        )
+
+        urls = list(_PAPERS)
+        results = summarizer.process_urls(urls)
+
+        assert [r["url"] for r in results] == urls
+        assert cache.set.call_count == len(urls)
+
+    def test_stale_cache_entry_is_regenerated(self, tmp_path):
+        """测试缓存内容与 SummaryResult 字段不匹配时视为未命中并覆盖."""
+        fetcher = Mock()
+        fetcher.fetch.side_effect = _PAPERS.__getitem__
+        provider = Mock()
+        provider.is_available.return_value = True
+        provider.cache_fingerprint.return_value = "model"
+        provider.summarize_batch.side_effect = lambda items, **_: [
+            _DEFAULT_SUMMARY for _ in items
+        ]
+        cache = DiskCache(str(tmp_path / "papers.sqlite3"))
+        summarizer = PaperSummarizer(
+            fetcher=fetcher, llm_provider=provider, summary_cache=cache
+        )
+        paper = _PAPERS["https://arxiv.org/abs/1"]
+        key = summarizer._summary_cache_key(paper.title, paper.abstract)
+        cache.set(key, {"summary": "S", "obsolete_field": "x"})
 
-    def test_process_urls_empty_list(self, summarizer):
-        """测试空列表."""
-        results = summarizer.process_urls([])
+        results = summarizer.process_urls(list(_PAPERS))
 
-        assert results == []
-        summarizer.fetcher.fetch.assert_not_called()
+        assert [r["summary"] for r in results] == ["Summary"] * len(_PAPERS)
+        assert cache.get(key) == _DEFAULT_SUMMARY.to_dict()
+        cache.close()
@@ -0,0 +1,76 @@
+"""RateLimiter 测试."""
+
+from src.llm_providers.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """可手动推进的时钟."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """测试 RateLimiter."""
+
+    def test_disabled_by_default(self):
+        """测试默认不限流."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+        for _ in range(100):
+            limiter.acquire(10_000)
+
+        assert not limiter.enabled
+        assert clock.sleeps == []
+
+    def test_requests_per_minute(self):
+        """测试超过 RPM 后等待令牌补充."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=2, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [30.0]
+
+    def test_fractional_requests_per_minute(self):
+        """测试 RPM 小于 1 时按补充速率等待，不会永久阻塞."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=0.5, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [120.0]
+
+    def test_tokens_per_minute(self):
+        """测试超过 TPM 后按缺口等待."""
+        clock = FakeClock()
+        limiter = RateLimiter(tokens_per_minute=600, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire(600)
+        limiter.acquire(100)
+
+        assert clock.sleeps == [10.0]
+
+    def test_tokens_larger_than_capacity(self):
+        """测试单次 token 超过容量时按容量计，不会永久阻塞."""
+        clock = FakeClock()
+        limiter = RateLimiter(tokens_per_minute=100, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire(1000)
+        limiter.acquire(1000)
+
+        assert clock.sleeps == [60.0]
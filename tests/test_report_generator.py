@@ -1,10 +1,19 @@
 """Report Generator 模块测试."""
 
+import re
+
 import pytest
 
 from src.config import ReportConfig
 from src.report_generator import ReportGenerator
 
+# HTML 报告的基本结构：文档类型、标题、样式和正文标题按顺序出现
+_HTML_REQUIRED = re.compile(
+    r"<!DOCTYPE html>.*<html>.*<title>学术周报.*<style>.*</style>"
+    r".*<h1>学术周报.*</html>",
+    re.DOTALL,
+)
+
 
 class TestReportGenerator:
     """测试 ReportGenerator."""
@@ -14,36 +23,6 @@ class TestReportGenerator:
         """创建 Generator 实例."""
         return ReportGenerator()
 
-    @pytest.fixture
-    def sample_papers(self):
-        """示例论文数据."""
-        return [
-            {
-                "title": "Test Paper 1",
-                "authors": ["Author A", "Author B"],
-                "url": "https://arxiv.org/abs/2401.00001",
-                "year": "2024",
-                "venue": "ICML",
-                "summary": "一句话总结1",
-                "background": "研究背景1",
-                "method": "核心方法1",
-                "results": "主要结果1",
-                "relevance_score": 8.5,
-            },
-            {
-                "title": "Test Paper 2",
-                "authors": ["Author C"],
-                "url": "https://arxiv.org/abs/2401.00002",
-                "year": "2023",
-                "venue": "",
-                "summary": "一句话总结2",
-                "background": "",
-                "method": "核心方法2",
-                "results": "",
-                "relevance_score": 7.0,
-            },
-        ]
-
     def test_init_default_config(self):
         """测试使用默认配置初始化."""
         generator = ReportGenerator()
@@ -64,23 +43,6 @@ class TestGenerateMarkdown:
     def generator(self):
         return ReportGenerator()
 
-    @pytest.fixture
-    def sample_papers(self):
-        return [
-            {
-                "title": "Test Paper 1",
-                "authors": ["Author A", "Author B"],
-                "url": "https://arxiv.org/abs/2401.00001",
-                "year": "2024",
-                "venue": "ICML",
-                "summary": "一句话总结1",
-                "background": "研究背景1",
-                "method": "核心方法1",
-                "results": "主要结果1",
-                "relevance_score": 8.5,
-            },
-        ]
-
     def test_generate_markdown_with_papers(self, generator, sample_papers):
         """测试生成包含论文的 Markdown 报告."""
         report = generator.generate_markdown(sample_papers)
@@ -129,41 +91,18 @@ class TestGenerateHtml:
     def generator(self):
         return ReportGenerator()
 
-    @pytest.fixture
-    def sample_papers(self):
-        return [
-            {
-                "title": "Test Paper 1",
-                "authors": ["Author A"],
-                "url": "https://arxiv.org/abs/2401.00001",
-                "year": "2024",
-                "summary": "一句话总结",
-                "relevance_score": 8.0,
-            },
-        ]
-
     def test_generate_html_with_papers(self, generator, sample_papers):
         """测试生成包含论文的 HTML 报告."""
         report = generator.generate_html(sample_papers)
 
-        # 检查基本结构
-        assert "<!DOCTYPE html>" in report
-        assert "<html>" in report
-        assert "</html>" in report
-
-        # 检查标题
-        assert "<title>学术周报" in report
-        assert "<h1>学术周报" in report
+        # 检查基本结构、标题和样式
+        assert _HTML_REQUIRED.search(report)
 
         # 检查内容
         assert "Test Paper 1" in report
         assert "Author A" in report
         assert "一句话总结" in report
 
-        # 检查样式
-        assert "<style>" in report
-        assert "</style>" in report
-
     def test_generate_html_empty(self, generator):
         """测试生成空 HTML 报告."""
         report = generator.generate_html([])
@@ -221,6 +160,23 @@ class TestFormatPaper:
         assert "Author 1" in formatted
         assert "8.0/10" in formatted
 
+    def test_format_paper_html_escapes_fields(self, generator):
+        """测试 HTML 格式化会转义论文字段."""
+        paper = {
+            "title": "A <script>alert(1)</script> Paper",
+            "authors": ["O'Brien & Co"],
+            "url": 'https://example.com/?a=1&b="2"',
+            "summary": "x < y",
+        }
+
+        formatted = generator._format_paper_html(1, paper)
+
+        assert "<script>" not in formatted
+        assert "A &lt;script&gt;alert(1)&lt;/script&gt; Paper" in formatted
+        assert "O&#x27;Brien &amp; Co" in formatted
+        assert 'href="https://example.com/?a=1&amp;b=&quot;2&quot;"' in formatted
+        assert "x &lt; y" in formatted
+
     def test_format_paper_missing_fields(self, generator):
         """测试格式化缺少字段的论文."""
         paper = {
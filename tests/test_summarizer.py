@@ -1,13 +1,36 @@
 """LLM Provider 模块测试."""
 
+import asyncio
 import json
-from unittest.mock import Mock, patch
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from src.llm_providers import LLMError, OpenAIProvider, SummaryResult
 
 
+_SUCCESS_CONTENT = json.dumps(
+    {
+        "summary": "测试总结",
+        "background": "测试背景",
+        "method": "测试方法",
+        "results": "测试结果",
+    }
+)
+# 缺少 summary 以外的字段
+_PARTIAL_CONTENT = json.dumps({"summary": "测试总结"})
+
+
+def _resp(content):
+    """构造 chat.completions.create 的响应对象."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
 class TestSummaryResult:
     """测试 SummaryResult."""
 
@@ -42,22 +65,38 @@ class TestSummaryResult:
         assert data["summary"] == "Test summary"
         assert data["relevance_score"] == 7.0
 
+    def test_uses_slots(self):
+        """测试使用 __slots__，不能设置未声明的属性."""
+        result = SummaryResult(summary="s", background="b", method="m", results="r")
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = "x"
+
+
+@pytest.fixture(scope="module")
+def shared_openai_provider():
+    """模块内共用的 Provider 实例，只构建一次."""
+    with patch.dict(
+        "os.environ",
+        {
+            "OPENAI_API_KEY": "sk-test123",
+            "OPENAI_BASE_URL": "https://api.openai.com/v1",
+            "OPENAI_MODEL": "gpt-4o-mini",
+        },
+    ):
+        return OpenAIProvider()
+
 
 class TestOpenAIProvider:
     """测试 OpenAIProvider."""
 
     @pytest.fixture
-    def provider(self):
-        """创建 Provider 实例."""
-        with patch.dict(
-            "os.environ",
-            {
-                "OPENAI_API_KEY": "sk-test123",
-                "OPENAI_BASE_URL": "https://api.openai.com/v1",
-                "OPENAI_MODEL": "gpt-4o-mini",
-            },
-        ):
-            return OpenAIProvider()
+    def provider(self, shared_openai_provider):
+        """清空缓存客户端后的共用 Provider，使每个测试的 patch 生效."""
+        shared_openai_provider._client = None
+        shared_openai_provider._aclient = None
+        return shared_openai_provider
 
     def test_is_available_with_key(self, provider):
         """测试有 API Key 时可用."""
@@ -80,21 +119,7 @@ class TestOpenAIProvider:
     def test_summarize_success(self, mock_openai_class, provider):
         """测试成功生成摘要."""
         # 模拟 API 响应
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(
-                message=Mock(
-                    content=json.dumps(
-                        {
-                            "summary": "测试总结",
-                            "background": "测试背景",
-                            "method": "测试方法",
-                            "results": "测试结果",
-                        }
-                    )
-                )
-            )
-        ]
+        mock_response = _resp(_SUCCESS_CONTENT)
 
         mock_client = Mock()
         mock_client.chat.completions.create.return_value = mock_response
@@ -121,8 +146,7 @@ class TestOpenAIProvider:
     @patch("src.llm_providers.openai_provider.OpenAI")
     def test_summarize_invalid_json(self, mock_openai_class, provider):
         """测试返回无效 JSON."""
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content="Invalid JSON"))]
+        mock_response = _resp("Invalid JSON")
 
         mock_client = Mock()
         mock_client.chat.completions.create.return_value = mock_response
@@ -134,19 +158,7 @@ class TestOpenAIProvider:
     @patch("src.llm_providers.openai_provider.OpenAI")
     def test_summarize_missing_fields(self, mock_openai_class, provider):
         """测试返回缺少字段的 JSON."""
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(
-                message=Mock(
-                    content=json.dumps(
-                        {
-                            "summary": "测试总结",
-                            # 缺少其他字段
-                        }
-                    )
-                )
-            )
-        ]
+        mock_response = _resp(_PARTIAL_CONTENT)
 
         mock_client = Mock()
         mock_client.chat.completions.create.return_value = mock_response
@@ -160,8 +172,7 @@ class TestOpenAIProvider:
     @patch("src.llm_providers.openai_provider.OpenAI")
     def test_summarize_empty_response(self, mock_openai_class, provider):
         """测试返回空内容."""
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content=None))]
+        mock_response = _resp(None)
 
         mock_client = Mock()
         mock_client.chat.completions.create.return_value = mock_response
@@ -170,6 +181,70 @@ class TestOpenAIProvider:
         with pytest.raises(LLMError, match="返回空内容"):
             provider.summarize("Test Title", "Test Abstract")
 
+    @patch("src.llm_providers.openai_provider.AsyncOpenAI")
+    def test_summarize_many_preserves_order(self, mock_async_class, provider):
+        """测试异步批量摘要保持输入顺序，失败条目返回 None."""
+
+        async def _create(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            if "Bad" in prompt:
+                raise Exception("API Error")
+            title = "A" if "Paper A" in prompt else "B"
+            return _resp(json.dumps({"summary": title}))
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = _create
+        mock_async_class.return_value = mock_client
+
+        results = asyncio.run(
+            provider.summarize_many(
+                [("Paper A", "x"), ("Bad", "y"), ("Paper B", "z")], concurrency=2
+            )
+        )
+
+        assert results[0].summary == "A"
+        assert results[1] is None
+        assert results[2].summary == "B"
+        mock_async_class.assert_called_once()
+
+    @patch("src.llm_providers.openai_provider.AsyncOpenAI")
+    def test_summarize_batch_closes_async_client(self, mock_async_class, provider):
+        """测试同步批量接口可重复调用，每次结束后关闭异步客户端."""
+
+        async def _create(**kwargs):
+            return _resp(json.dumps({"summary": "S"}))
+
+        def _make_client(**kwargs):
+            client = Mock()
+            client.chat.completions.create = _create
+            client.close = AsyncMock()
+            return client
+
+        mock_async_class.side_effect = _make_client
+
+        first = provider.summarize_batch([("Paper A", "x")])
+        second = provider.summarize_batch([("Paper B", "y")])
+
+        assert first[0].summary == second[0].summary == "S"
+        assert mock_async_class.call_count == 2
+        assert provider._aclient is None
+
+    @patch("src.llm_providers.openai_provider.OpenAI")
+    def test_get_client_shared_across_threads(self, mock_openai_class, provider):
+        """测试并发首次调用只创建一个客户端（共用连接池）."""
+
+        def _slow_client(**kwargs):
+            time.sleep(0.05)
+            return Mock()
+
+        mock_openai_class.side_effect = _slow_client
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(executor.map(lambda _: provider._get_client(), range(4)))
+
+        mock_openai_class.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
     def test_build_prompt(self, provider):
         """测试 Prompt 构建."""
         prompt = provider._build_prompt("Test Title", "Test Abstract")
@@ -179,6 +254,25 @@ class TestOpenAIProvider:
         assert "JSON" in prompt
         assert "summary" in prompt
 
+    def test_cache_fingerprint_tracks_generation_config(self):
+        """测试模型、生成参数或 Prompt 变化时缓存指纹随之变化."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=True):
+            provider = OpenAIProvider()
+            fingerprint = provider.cache_fingerprint()
+
+            assert OpenAIProvider().cache_fingerprint() == fingerprint
+
+            provider.temperature = 0.7
+            assert provider.cache_fingerprint() != fingerprint
+            provider.temperature = 0.3
+
+            provider.max_tokens = 2000
+            assert provider.cache_fingerprint() != fingerprint
+            provider.max_tokens = 1000
+
+            with patch.object(provider, "_build_prompt", return_value="new prompt"):
+                assert provider.cache_fingerprint() != fingerprint
+
     def test_get_client_without_api_key(self):
         """测试无 API Key 时获取客户端失败."""
         with patch.dict("os.environ", {"OPENAI_API_KEY": ""}, clear=True):
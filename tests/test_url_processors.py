@@ -1,10 +1,14 @@
 """URL 处理器模块测试."""
 
+from unittest.mock import Mock
+
 import pytest
 
+from src.fetchers import url_processors
 from src.fetchers.url_processors import (
     ArxivProcessor,
     GoogleScholarProcessor,
+    URLProcessor,
     URLProcessorChain,
     default_processor_chain,
     process_paper_url,
@@ -12,6 +16,22 @@ from src.fetchers.url_processors import (
 )
 
 
+class _DoiProcessor(URLProcessor):
+    """测试用的 DOI 链接处理器."""
+
+    __slots__ = ()
+
+    HOST_MARKERS = ("doi.org",)
+
+    def can_process(self, url: str) -> bool:
+        """检查是否是 DOI 链接."""
+        return "doi.org" in url
+
+    def process(self, url: str) -> str:
+        """将 DOI 链接转换为 ACM 页面."""
+        return url.replace("https://doi.org/", "https://dl.acm.org/doi/")
+
+
 class TestGoogleScholarProcessor:
     """测试 Google Scholar 处理器."""
 
@@ -29,77 +49,85 @@ class TestGoogleScholarProcessor:
             "https://scholar.google.com/scholar_url?hl=zh-CN&url=https://example.com"
         )
 
+    def test_can_process_non_canonical_scholar_url(self, processor):
+        """测试非规范写法的 Scholar 链接走完整解析仍能识别."""
+        assert processor.can_process(
+            "http://Scholar.Google.com/scholar_url?url=https://example.com"
+        )
+        assert not processor.can_process(
+            "https://scholar.google.com/scholar?cluster=123"
+        )
+
     def test_cannot_process_regular_url(self, processor):
         """测试不能识别普通 URL."""
         assert not processor.can_process("https://arxiv.org/abs/1234")
         assert not processor.can_process("https://example.com")
 
-    def test_process_simple_url(self, processor):
-        """测试处理简单的 scholar URL."""
-        url = "https://scholar.google.com/scholar_url?url=https://arxiv.org/pdf/2401.12345"
-        result = processor.process(url)
-        assert result == "https://arxiv.org/pdf/2401.12345"
-
-    def test_process_complex_url(self, processor):
-        """测试处理复杂的 scholar URL（带多个参数）."""
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "https://scholar.google.com/scholar_url?url=https://arxiv.org/pdf/2401.12345",
+                "https://arxiv.org/pdf/2401.12345",
+                id="simple",
+            ),
+            pytest.param(
+                "https://scholar.google.com/scholar_url?"
+                "url=https://arxiv.org/pdf/2602.09302&"
+                "hl=zh-CN&sa=X&d=14589868630261160684",
+                "https://arxiv.org/pdf/2602.09302",
+                id="complex",
+            ),
+            pytest.param(
+                "https://scholar.google.com/scholar_url?url=https%3A%2F%2Farxiv.org%2Fpdf%2F2401.12345",
+                "https://arxiv.org/pdf/2401.12345",
+                id="url_encoded",
+            ),
+            pytest.param(
+                "https://scholar.google.com/scholar_url?"
+                "url=https://dl.acm.org/doi/10.1145/1234567.8901234",
+                "https://dl.acm.org/doi/10.1145/1234567.8901234",
+                id="acm",
+            ),
+            pytest.param(
+                "https://scholar.google.com/scholar_url?"
+                "url=https://ieeexplore.ieee.org/document/1234567",
+                "https://ieeexplore.ieee.org/document/1234567",
+                id="ieee",
+            ),
+            pytest.param(
+                "https://scholar.google.com/scholar_url?"
+                "url=https://ieeexplore.ieee.org/abstract/document/1234567/",
+                "https://ieeexplore.ieee.org/abstract/document/1234567/",
+                id="ieee_abstract_document",
+            ),
+            pytest.param(
+                "https://scholar.google.com/scholar_share?"
+                "url=https://ieeexplore.ieee.org/abstract/document/1234567/&"
+                "rt=Test+Paper",
+                "https://ieeexplore.ieee.org/abstract/document/1234567/",
+                id="scholar_share",
+            ),
+            # 没有 url 参数时返回原始 URL
+            pytest.param(
+                "https://scholar.google.com/scholar_url?hl=zh-CN",
+                "https://scholar.google.com/scholar_url?hl=zh-CN",
+                id="invalid",
+            ),
+        ],
+    )
+    def test_process(self, processor, url, expected):
+        """测试从 Scholar 重定向/分享链接中提取实际 URL."""
+        assert processor.process(url) == expected
+
+    def test_process_first_non_empty_param(self, processor):
+        """测试重复或空的 url 参数取首个非空值."""
         url = (
-            "https://scholar.google.com/scholar_url?"
-            "url=https://arxiv.org/pdf/2602.09302&"
-            "hl=zh-CN&sa=X&d=14589868630261160684"
+            "https://scholar.google.com/scholar_url?url=&hl=en&"
+            "url=https%3A%2F%2Farxiv.org%2Fabs%2F2301.00001&url=https://other.org/"
         )
-        result = processor.process(url)
-        assert result == "https://arxiv.org/pdf/2602.09302"
-
-    def test_process_url_encoded(self, processor):
-        """测试处理 URL 编码的链接."""
-        # URL 编码的空格和特殊字符
-        url = "https://scholar.google.com/scholar_url?url=https%3A%2F%2Farxiv.org%2Fpdf%2F2401.12345"
-        result = processor.process(url)
-        assert result == "https://arxiv.org/pdf/2401.12345"
-
-    def test_process_scholar_to_acm(self, processor):
-        """测试处理 Google Scholar 到 ACM 的重定向."""
-        url = (
-            "https://scholar.google.com/scholar_url?"
-            "url=https://dl.acm.org/doi/10.1145/1234567.8901234"
-        )
-        result = processor.process(url)
-        assert result == "https://dl.acm.org/doi/10.1145/1234567.8901234"
-
-    def test_process_scholar_to_ieee(self, processor):
-        """测试处理 Google Scholar 到 IEEE 的重定向."""
-        url = (
-            "https://scholar.google.com/scholar_url?"
-            "url=https://ieeexplore.ieee.org/document/1234567"
-        )
-        result = processor.process(url)
-        assert result == "https://ieeexplore.ieee.org/document/1234567"
-
-    def test_process_scholar_to_ieee_abstract_document(self, processor):
-        """测试处理 Google Scholar 到 IEEE abstract document 的重定向."""
-        url = (
-            "https://scholar.google.com/scholar_url?"
-            "url=https://ieeexplore.ieee.org/abstract/document/1234567/"
-        )
-        result = processor.process(url)
-        assert result == "https://ieeexplore.ieee.org/abstract/document/1234567/"
-
-    def test_process_scholar_share(self, processor):
-        """测试处理 Google Scholar 分享链接."""
-        url = (
-            "https://scholar.google.com/scholar_share?"
-            "url=https://ieeexplore.ieee.org/abstract/document/1234567/&"
-            "rt=Test+Paper"
-        )
-        result = processor.process(url)
-        assert result == "https://ieeexplore.ieee.org/abstract/document/1234567/"
-
-    def test_process_invalid_url(self, processor):
-        """测试处理无效的 scholar URL（没有 url 参数）."""
-        url = "https://scholar.google.com/scholar_url?hl=zh-CN"
-        result = processor.process(url)
-        # 应该返回原始 URL
-        assert result == url
+        result = processor.process_with_metadata(url)
+        assert result.url == "https://arxiv.org/abs/2301.00001"
 
 
 class TestArxivProcessor:
@@ -121,37 +149,65 @@ class TestArxivProcessor:
         assert not processor.can_process("https://scholar.google.com/...")
         assert not processor.can_process("https://ieee.org/...")
 
-    def test_process_pdf_to_abs(self, processor):
-        """测试将 PDF 链接转换为 Abstract."""
-        url = "https://arxiv.org/pdf/2401.12345.pdf"
-        result = processor.process(url)
-        assert result == "https://arxiv.org/abs/2401.12345"
-
-    def test_process_pdf_without_extension(self, processor):
-        """测试处理没有 .pdf 后缀的 PDF 链接."""
-        url = "https://arxiv.org/pdf/2401.12345"
-        result = processor.process(url)
-        assert result == "https://arxiv.org/abs/2401.12345"
-
-    def test_process_abs_no_change(self, processor):
-        """测试 Abstract 链接保持不变."""
-        url = "https://arxiv.org/abs/2401.12345"
-        result = processor.process(url)
-        assert result == "https://arxiv.org/abs/2401.12345"
-
-    def test_process_with_version(self, processor):
-        """测试处理带版本的 arXiv ID."""
-        url = "https://arxiv.org/pdf/2401.12345v2.pdf"
-        result = processor.process(url)
-        assert result == "https://arxiv.org/abs/2401.12345"
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                "https://arxiv.org/abs/2401.12345",
+                id="pdf_to_abs",
+            ),
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345",
+                "https://arxiv.org/abs/2401.12345",
+                id="pdf_without_extension",
+            ),
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345",
+                "https://arxiv.org/abs/2401.12345",
+                id="abs_no_change",
+            ),
+            pytest.param(
+                "https://export.arxiv.org/pdf/2401.1234.pdf?download=1",
+                "https://arxiv.org/abs/2401.1234",
+                id="pdf_with_query",
+            ),
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345v2.pdf",
+                "https://arxiv.org/abs/2401.12345",
+                id="with_version",
+            ),
+        ],
+    )
+    def test_process(self, processor, url, expected):
+        """测试将各种 arXiv 链接转换为规范的 Abstract 页面."""
+        assert processor.process(url) == expected
+
+    def test_process_abs_normalizes_non_canonical(self, processor):
+        """测试非规范的 Abstract 链接仍会规范化."""
+        assert (
+            processor.process("http://arxiv.org/abs/2401.12345v3")
+            == "https://arxiv.org/abs/2401.12345"
+        )
+        assert (
+            processor.process("https://arxiv.org/abs/2401.12345?context=cs")
+            == "https://arxiv.org/abs/2401.12345"
+        )
 
     def test_process_old_style_arxiv(self, processor):
         """测试处理旧格式 arXiv ID (例如 cs/0112001)."""
-        url = "https://arxiv.org/pdf/cs/0112001"
-        # 旧格式可能无法正确提取，但至少不会报错
-        result = processor.process(url)
-        # 应该返回原样或转换后的 URL
-        assert "arxiv.org" in result
+        assert (
+            processor.process("https://arxiv.org/pdf/cs/0112001")
+            == "https://arxiv.org/abs/cs/0112001"
+        )
+        assert (
+            processor.process("https://arxiv.org/pdf/math.GT/0309136v2.pdf")
+            == "https://arxiv.org/abs/math.GT/0309136"
+        )
+        assert (
+            processor.process("http://arxiv.org/abs/hep-th/9901001")
+            == "https://arxiv.org/abs/hep-th/9901001"
+        )
 
 
 class TestURLProcessorChain:
@@ -188,6 +244,80 @@ class TestURLProcessorChain:
         result = chain.process(url)
         assert result == "https://arxiv.org/abs/2401.12345"
 
+    def test_host_markers_skip_unrelated_urls(self):
+        """测试所有处理器声明 HOST_MARKERS 时，无关 URL 不再询问处理器."""
+        processor = Mock(spec=ArxivProcessor)
+        processor.HOST_MARKERS = ("arxiv.org",)
+        chain = URLProcessorChain([processor])
+
+        assert chain.process("https://dl.acm.org/doi/10.1145/1") == (
+            "https://dl.acm.org/doi/10.1145/1"
+        )
+        assert chain.process_with_metadata("https://example.com").url == (
+            "https://example.com"
+        )
+        processor.can_process.assert_not_called()
+
+        processor.can_process.return_value = False
+        chain.process("https://ArXiv.org/abs/2401.12345")
+        processor.can_process.assert_called_once()
+
+    def test_processor_without_host_markers_disables_fast_path(self):
+        """测试添加未声明 HOST_MARKERS 的处理器后，所有 URL 都交给处理器判断."""
+        processor = Mock(spec=ArxivProcessor)
+        processor.HOST_MARKERS = None
+        processor.can_process.return_value = False
+        chain = URLProcessorChain([ArxivProcessor()]).add_processor(processor)
+
+        chain.process("https://dl.acm.org/doi/10.1145/1")
+
+        processor.can_process.assert_called_once_with(
+            "https://dl.acm.org/doi/10.1145/1"
+        )
+
+    def test_add_to_default_chain_clears_url_cache(self, monkeypatch):
+        """测试向默认链添加处理器后，process_paper_url 不再返回旧的缓存结果."""
+        chain = URLProcessorChain([GoogleScholarProcessor(), ArxivProcessor()])
+        monkeypatch.setattr(url_processors, "default_processor_chain", chain)
+        url = "https://doi.org/10.1145/1"
+        try:
+            process_paper_url.cache_clear()
+            assert process_paper_url(url) == url
+
+            chain.add_processor(_DoiProcessor())
+
+            assert process_paper_url(url) == "https://dl.acm.org/doi/10.1145/1"
+            assert process_paper_url_with_metadata(url).url == (
+                "https://dl.acm.org/doi/10.1145/1"
+            )
+        finally:
+            process_paper_url.cache_clear()
+            process_paper_url_with_metadata.cache_clear()
+
+    def test_processors_are_read_only(self):
+        """测试 processors 只读，添加处理器后两种处理方式结果一致."""
+        chain = URLProcessorChain([GoogleScholarProcessor()])
+
+        with pytest.raises(AttributeError):
+            chain.processors.append(ArxivProcessor())
+        with pytest.raises(AttributeError):
+            chain.processors = []
+
+        chain.add_processor(ArxivProcessor())
+        url = "https://scholar.google.com/scholar_url?url=https://arxiv.org/pdf/2401.12345"
+        assert (
+            chain.process(url)
+            == chain.process_with_metadata(url).url
+            == ("https://arxiv.org/abs/2401.12345")
+        )
+
+    def test_uses_slots(self):
+        """测试处理器与处理器链使用 __slots__，实例没有 __dict__."""
+        chain = URLProcessorChain([GoogleScholarProcessor(), ArxivProcessor()])
+
+        assert not hasattr(chain, "__dict__")
+        assert all(not hasattr(p, "__dict__") for p in chain.processors)
+
 
 class TestDefaultProcessorChain:
     """测试默认处理器链."""
@@ -244,6 +374,15 @@ class TestProcessPaperUrl:
         result = process_paper_url(url)
         assert result == "https://arxiv.org/abs/2401.12345"
 
+    def test_process_paper_url_memoized(self):
+        """测试相同 URL 的重复处理命中缓存."""
+        url = "https://arxiv.org/pdf/2401.54321.pdf"
+        process_paper_url(url)
+        hits = process_paper_url.cache_info().hits
+
+        assert process_paper_url(url) == "https://arxiv.org/abs/2401.54321"
+        assert process_paper_url.cache_info().hits == hits + 1
+
     def test_scholar_share_with_title_hint(self):
         """测试处理 Scholar share 链接并保留标题提示."""
         url = (